@@ -1,11 +1,14 @@
 # topics: dp
 
-from functools import lru_cache
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.dp_stack import stack_dp
 
 class Solution:
     def numDecodings(self, s: str) -> int:
 
-        @lru_cache(None)
+        @stack_dp(shape=(len(s) + 1,))
         def dp(i: int) -> int:
             if i == len(s):
                 return 1
@@ -13,12 +16,98 @@ class Solution:
                 return 0
 
             # take one character
-            ways = dp(i + 1)
+            ways = yield i + 1
 
             # take two characters if valid (10..26)
             if i + 1 < len(s) and (s[i] == '1' or (s[i] == '2' and s[i + 1] <= '6')):
-                ways += dp(i + 2)
+                ways += yield i + 2
 
             return ways
 
-        return dp(0)
\ No newline at end of file
+        return dp(0)
+
+
+# --- streaming and chunk-parallel versions for huge digit streams ---
+#
+# Forward form: f[i] = ways to decode the first i digits,
+# f[i] = one(c[i]) * f[i-1] + two(c[i-1], c[i]) * f[i-2], f[0] = 1.
+# So (f[i], f[i-1]) is a 2x2 matrix step of the previous pair, and only the
+# pair straddling a chunk border needs the previous chunk's last digit.
+
+_NOT_DIGITS = bytes(b for b in range(256) if not 48 <= b <= 57)
+_ZERO, _ONE, _TWO, _SIX = b"0126"
+
+def _two(prev: int, cur: int) -> int:
+    return 1 if prev == _ONE or (prev == _TWO and cur <= _SIX) else 0
+
+def num_decodings_stream(chunks, mod: int = 0) -> int:
+    """
+    O(1) memory: `chunks` is any iterable of str/bytes pieces (a file object, a
+    generator, or just a str). Anything that isn't a digit is skipped.
+    """
+    f, g, prev = 1, 0, None
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        for c in chunk.translate(None, _NOT_DIGITS):
+            two = _two(prev, c) if prev is not None else 0
+            f, g = (f if c != _ZERO else 0) + (g if two else 0), f
+            if mod:
+                f %= mod
+            prev = c
+    return f
+
+def _chunk_transfer(path: str, start: int, stop: int, mod: int):
+    """
+    Returns (first digit, last digit, (p1, q1, p2, q2)) for the digits in
+    path[start:stop]. The 2x2 matrix maps the state right after the first digit
+    to the state after the last one, so it doesn't depend on the previous chunk.
+    """
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        digits = fh.read(stop - start).translate(None, _NOT_DIGITS)
+    if not digits:
+        return None
+    p1, q1, p2, q2 = 1, 0, 0, 1
+    prev = digits[0]
+    for c in digits[1:]:
+        one = 0 if c == _ZERO else 1
+        if _two(prev, c):
+            p1, q1 = one * p1 + q1, p1
+            p2, q2 = one * p2 + q2, p2
+        else:
+            p1, q1 = one * p1, p1
+            p2, q2 = one * p2, p2
+        if mod:
+            p1, p2 = p1 % mod, p2 % mod
+        prev = c
+    return digits[0], digits[-1], (p1, q1, p2, q2)
+
+def num_decodings_file(path: str, mod: int = 0, workers: int = 1, chunk_size: int = 1 << 26) -> int:
+    """
+    Splits the file into byte ranges, turns each into a transfer matrix (in a
+    process pool when workers > 1; each worker reads its own range) and folds
+    the matrices in order, applying the boundary pair with the previous chunk's
+    last digit.
+    """
+    size = os.path.getsize(path)
+    ranges = [(s, min(s + chunk_size, size)) for s in range(0, size, chunk_size)]
+    args = ([path] * len(ranges), [a for a, _ in ranges], [b for _, b in ranges], [mod] * len(ranges))
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(_chunk_transfer, *args))
+    else:
+        parts = list(map(_chunk_transfer, *args))
+
+    f, g, last = 1, 0, None
+    for part in parts:
+        if part is None:
+            continue
+        first, tail, (p1, q1, p2, q2) = part
+        two = _two(last, first) if last is not None else 0
+        f, g = (f if first != _ZERO else 0) + (g if two else 0), f
+        f, g = p1 * f + p2 * g, q1 * f + q2 * g
+        if mod:
+            f, g = f % mod, g % mod
+        last = tail
+    return f
@@ -1,5 +1,10 @@
 # topics: dp
 
+from itertools import accumulate
+from operator import sub
+
+from algorithms.chunked import reduce_chunks, reduce_file
+
 class Solution:
     def maxProfit(self, prices: list[int]) -> int:
         min_stock = prices[0]
@@ -8,4 +13,25 @@ class Solution:
             min_stock = min(min_stock, p)
             profit = max(profit, p-min_stock)
         
-        return profit
\ No newline at end of file
+        return profit
+
+
+# --- associative summaries: reduce chunks independently, merge exactly ---
+#
+# A chunk is summarized by (lowest, highest, best profit inside the chunk).
+# Across a border the best trade buys at the left chunk's lowest and sells at
+# the right chunk's highest, so merge() is associative.
+
+def profit_summary(chunk) -> tuple:
+    return min(chunk), max(chunk), max(map(sub, chunk, accumulate(chunk, min)))
+
+def merge_profit(a: tuple, b: tuple) -> tuple:
+    return min(a[0], b[0]), max(a[1], b[1]), max(a[2], b[2], b[1] - a[0])
+
+def max_profit_chunks(chunks, workers: int = 1):
+    # chunks: non-empty sequences of prices in order
+    return reduce_chunks(chunks, profit_summary, merge_profit, workers)[2]
+
+def max_profit_file(path: str, typecode: str = 'q', workers: int = 1, chunk_items: int = 1 << 22):
+    """Same answer over a raw binary array file; each worker reads its own slice."""
+    return reduce_file(path, profit_summary, merge_profit, typecode, workers, chunk_items)[2]
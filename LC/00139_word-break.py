@@ -1,11 +1,11 @@
 # topics: dp
 
-from functools import lru_cache
+from algorithms.dp_memo import memo
 
 class Solution:
     def wordBreak(self, s: str, wordDict: list[str]) -> bool:
 
-        @lru_cache(None)
+        @memo(shape=(len(s) + 1,), typecode='b')
         def dp(i: int) -> bool:
             if i == len(s):
                 return True
@@ -17,4 +17,75 @@ class Solution:
             
             return False
 
-        return dp(0)
\ No newline at end of file
+        return dp(0)
+
+# --- one dictionary, many strings ---
+
+class WordDict:
+    """
+    Trie compiled once from the dictionary. Segmenting walks the trie forward
+    from every reachable position, so a query costs O(n * longest word) with no
+    slicing, independent of the dictionary size.
+    """
+    def __init__(self, words):
+        self.children = [{}]
+        self.is_word = [False]
+        for w in words:
+            node = 0
+            for ch in w:
+                nxt = self.children[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.children)
+                    self.children[node][ch] = nxt
+                    self.children.append({})
+                    self.is_word.append(False)
+                node = nxt
+            self.is_word[node] = True
+
+    def segment(self, s: str, mod: int = 0):
+        """
+        Returns (breakable, number of segmentations, one segmentation as a list of
+        words or None). With `mod`, the count is taken modulo it.
+        """
+        n = len(s)
+        children, is_word = self.children, self.is_word
+        count = [0] * (n + 1)
+        count[0] = 1
+        back = [-1] * (n + 1)   # start of the last word of one segmentation ending here
+        back[0] = 0
+
+        for i in range(n):
+            if back[i] == -1:
+                continue
+            ways = count[i]
+            node = 0
+            for j in range(i, n):
+                node = children[node].get(s[j])
+                if node is None:
+                    break
+                if is_word[node]:
+                    count[j + 1] += ways
+                    if mod:
+                        count[j + 1] %= mod
+                    if back[j + 1] == -1:
+                        back[j + 1] = i
+
+        if back[n] == -1:
+            return False, 0, None
+        words = []
+        j = n
+        while j:
+            words.append(s[back[j]:j])
+            j = back[j]
+        words.reverse()
+        return True, count[n], words
+
+    def word_break(self, s: str) -> bool:
+        return self.segment(s)[0]
+
+    def word_break_many(self, strings) -> list[bool]:
+        return [self.segment(s)[0] for s in strings]
+
+    def segment_many(self, strings, mod: int = 0):
+        for s in strings:
+            yield self.segment(s, mod)
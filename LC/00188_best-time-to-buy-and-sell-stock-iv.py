@@ -1,10 +1,12 @@
 # topics: dp
 
-from functools import lru_cache
+from algorithms.dp_memo import memo
 
 class Solution:
     def maxProfit(self, k: int, prices: list[int]) -> int:
-        @lru_cache(None)
+        k = min(k, len(prices) // 2)  # more transactions than that never bind
+
+        @memo(shape=(len(prices) + 1, k + 1, 2), typecode='q')
         def dp(day, transactions_left, holding):
             if day == len(prices):
                 return 0
@@ -24,4 +26,100 @@ class Solution:
             
             return max(do_nothing, profit)
 
-        return dp(0, k, 0)
\ No newline at end of file
+        return dp(0, k, 0)
+
+# --- long price series, large k ---
+
+NEG = -(1 << 62)
+
+def max_profit_unlimited(prices: list[int]) -> int:
+    # k >= n // 2 never binds: take every positive delta
+    return sum(max(0, b - a) for a, b in zip(prices, prices[1:]))
+
+def max_profit_rolling(k: int, prices: list[int]) -> int:
+    """
+    buy[j]/sell[j]: best cash holding / not holding after at most j buys.
+    O(n*k) time, O(k) memory.
+    """
+    if k >= len(prices) // 2:
+        return max_profit_unlimited(prices)
+    buy = [NEG] * (k + 1)
+    sell = [0] * (k + 1)
+    for p in prices:
+        for j in range(1, k + 1):
+            if sell[j - 1] - p > buy[j]:
+                buy[j] = sell[j - 1] - p
+            if buy[j] + p > sell[j]:
+                sell[j] = buy[j] + p
+    return sell[k]
+
+def _best_with_fee(prices: list[int], fee: int):
+    # unlimited transactions, `fee` per sale; ties broken towards fewer sales
+    cash, cash_cnt = 0, 0
+    hold, hold_cnt = NEG, 0
+    for p in prices:
+        sold = hold + p - fee
+        if sold > cash or (sold == cash and hold_cnt + 1 < cash_cnt):
+            new_cash, new_cnt = sold, hold_cnt + 1
+        else:
+            new_cash, new_cnt = cash, cash_cnt
+        bought = cash - p
+        if bought > hold or (bought == hold and cash_cnt < hold_cnt):
+            hold, hold_cnt = bought, cash_cnt
+        cash, cash_cnt = new_cash, new_cnt
+    return cash, cash_cnt
+
+def max_profit_aliens(k: int, prices: list[int]) -> int:
+    """
+    Lagrangian relaxation ("Aliens trick"). Best profit P(t) with t transactions is
+    concave in t, so charging a fee per transaction and binary searching the
+    smallest fee whose optimum uses <= k transactions gives
+    P(k) = profit(fee) + fee * k. O(n log max(prices)), independent of k.
+    """
+    if k == 0 or len(prices) < 2:
+        return 0
+    if k >= len(prices) // 2:
+        return max_profit_unlimited(prices)
+    lo, hi = 0, max(prices)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _best_with_fee(prices, mid)[1] <= k:
+            hi = mid
+        else:
+            lo = mid + 1
+    profit, _ = _best_with_fee(prices, lo)
+    return profit + lo * k
+
+class StreamingTrader:
+    """
+    Feed prices one at a time; `profit` is the best with at most k transactions
+    so far. Only ceil(seen / 2) buys are possible after `seen` prices, so the
+    rolling arrays grow lazily up to k.
+    """
+    def __init__(self, k: int):
+        self.k = k
+        self.seen = 0
+        self.buy = [NEG]
+        self.sell = [0]
+
+    def push(self, p: int) -> int:
+        self.seen += 1
+        buy, sell = self.buy, self.sell
+        if len(buy) <= min(self.k, (self.seen + 1) // 2):
+            buy.append(buy[-1])
+            sell.append(sell[-1])
+        for j in range(1, len(buy)):
+            if sell[j - 1] - p > buy[j]:
+                buy[j] = sell[j - 1] - p
+            if buy[j] + p > sell[j]:
+                sell[j] = buy[j] + p
+        return sell[-1]
+
+    def extend(self, prices) -> int:
+        for p in prices:
+            self.push(p)
+        return self.profit
+
+    @property
+    def profit(self) -> int:
+        return self.sell[-1]
@@ -1,14 +1,17 @@
 # topics: dp
 
-from functools import lru_cache
+import mmap
+from array import array
 from typing import List 
 
+from algorithms.dp_memo import memo
+
 class Solution:
     def maximalSquare(self, matrix: List[List[str]]) -> int:
         m = len(matrix)
         n = len(matrix[0])
 
-        @lru_cache(None)
+        @memo(shape=(m + 1, n + 1), typecode='i')
         def dp(i, j):
             if i == m or j == n:
                 return 0
@@ -28,4 +31,58 @@ class Solution:
                 area = max(area, dp(i, j)**2)
 
         return area
-        
\ No newline at end of file
+
+
+# --- row streaming: O(n) state, rows never all in memory ---
+
+_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+def _as_bits(row) -> bytes:
+    # '0'/'1' strings or bytes, or sequences of 0/1 / "0"/"1" -> bytes of 0/1
+    if isinstance(row, str):
+        row = row.encode()
+    if isinstance(row, (bytes, bytearray, memoryview)):
+        return bytes(row).translate(_TO_BITS)
+    return bytes(1 if c == 1 or c == "1" else 0 for c in row)
+
+def largest_square(rows):
+    """
+    dp over one row at a time: side[j] = side of the largest all-ones square whose
+    bottom-right corner is in column j of the current row.
+    Returns (side, (top, left)) of the first largest square, or (0, None).
+    """
+    best, corner = 0, None
+    prev = None
+    for i, row in enumerate(rows):
+        bits = _as_bits(row)
+        if prev is None:
+            prev = array('i', [0]) * (len(bits) + 1)
+        cur = array('i', [0]) * len(prev)
+        for j, bit in enumerate(bits, 1):
+            if bit:
+                up, left, diag = prev[j], cur[j - 1], prev[j - 1]
+                side = (up if up < left else left)
+                side = (side if side < diag else diag) + 1
+                cur[j] = side
+                if side > best:
+                    best, corner = side, (i, j - 1)
+        prev = cur
+    if not best:
+        return 0, None
+    return best, (corner[0] - best + 1, corner[1] - best + 1)
+
+def iter_text_rows(path: str):
+    # one row of '0'/'1' characters per line
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.rstrip(b"\r\n")
+            if line:
+                yield line
+
+def iter_bitmap_rows(path: str, width: int):
+    # packed bitmap, 1 bit per cell (MSB first), each row padded to whole bytes
+    stride = (width + 7) // 8
+    bits = stride * 8
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for off in range(0, len(mm) - stride + 1, stride):
+            yield format(int.from_bytes(mm[off:off + stride], "big"), f"0{bits}b")[:width]
@@ -1,11 +1,14 @@
 # topics: dp
 
-from functools import lru_cache
+from array import array
+from bisect import bisect_left, bisect_right
+
+from algorithms.dp_memo import memo
 
 class Solution:
     def lengthOfLIS(self, nums: list[int]) -> int:
 
-        @lru_cache(None)
+        @memo(shape=(len(nums),), typecode='i')
         def dp(i):
             ans = 1
 
@@ -15,4 +18,50 @@ class Solution:
             
             return ans 
         
-        return max([dp(i) for i in range(len(nums))])
\ No newline at end of file
+        return max([dp(i) for i in range(len(nums))])
+
+# --- O(n log n) patience sorting, fed incrementally ---
+
+class PatienceLIS:
+    """
+    tails[k] = smallest last value of an increasing subsequence of length k + 1.
+    Each value is placed with one bisect; parents[i] points to the element before
+    value i in the best subsequence ending at i, so one LIS can be rebuilt.
+    strict=False gives the longest non-decreasing subsequence.
+    """
+    def __init__(self, strict: bool = True, typecode: str = 'q'):
+        self._place = bisect_left if strict else bisect_right
+        self.tails = []
+        self.tail_idx = array('q')
+        self.values = array(typecode)
+        self.parents = array('q')
+
+    def push(self, x) -> int:
+        i = len(self.values)
+        self.values.append(x)
+        k = self._place(self.tails, x)
+        self.parents.append(self.tail_idx[k - 1] if k else -1)
+        if k == len(self.tails):
+            self.tails.append(x)
+            self.tail_idx.append(i)
+        else:
+            self.tails[k] = x
+            self.tail_idx[k] = i
+        return len(self.tails)
+
+    def extend(self, values) -> int:
+        for x in values:
+            self.push(x)
+        return len(self.tails)
+
+    def __len__(self) -> int:
+        return len(self.tails)
+
+    def sequence(self) -> list:
+        out = []
+        i = self.tail_idx[-1] if self.tail_idx else -1
+        while i != -1:
+            out.append(self.values[i])
+            i = self.parents[i]
+        out.reverse()
+        return out
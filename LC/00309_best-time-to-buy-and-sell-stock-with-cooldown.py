@@ -1,23 +1,23 @@
 # topics: dp
 
-from functools import lru_cache
+from algorithms.dp_stack import stack_dp
 
 class Solution:
     def maxProfit(self, prices: list[int]) -> int:
         
-        @lru_cache(None)
+        @stack_dp(shape=(len(prices) + 2, 2))
         def dp(day, holding):
             if day >= len(prices):
                 return 0
 
             # do nothing 
-            do_nothing = dp(day+1, holding)
+            do_nothing = yield (day+1, holding)
 
             if holding:
                 # we are selling
-                do_something = prices[day] + dp(day + 2, 0)
+                do_something = prices[day] + (yield (day + 2, 0))
             else:
-                do_something = -prices[day] + dp(day+1, 1)
+                do_something = -prices[day] + (yield (day+1, 1))
             
             return max(do_nothing, do_something)
         
@@ -1,6 +1,8 @@
 # topics: dp
 
-from functools import lru_cache
+from array import array
+
+from algorithms.dp_stack import stack_dp
 
 class Solution:
     def coinChange(self, coins: list[int], amount: int) -> int:
@@ -12,7 +14,7 @@ class Solution:
         if not coins:
             return -1
 
-        @lru_cache(None)
+        @stack_dp(shape=(amount + 1,))
         def dp(pending_amount: int) -> int:
             if pending_amount == 0:
                 return 0
@@ -20,10 +22,50 @@ class Solution:
             best = float('inf')
             for current_denomination in coins:
                 if pending_amount >= current_denomination:
-                    sub = dp(pending_amount - current_denomination)
+                    sub = yield pending_amount - current_denomination
                     if sub != float('inf'):
                         best = min(best, 1 + sub)
             return best
 
         ans = dp(amount)
-        return -1 if ans == float('inf') else ans
\ No newline at end of file
+        return -1 if ans == float('inf') else ans
+
+
+# --- one coin set, many amounts ---
+
+UNREACHABLE = 1 << 30
+
+class CoinSet:
+    """
+    Bottom-up min-coins table shared by every query on the same denominations.
+    table[a] = fewest coins summing to a. The table only grows (at least
+    doubling), and growing it just fills the new tail, one denomination at a time.
+    """
+    def __init__(self, coins: list[int]):
+        self.coins = sorted({c for c in coins if c > 0})
+        self.table = array('i', [0])
+
+    def _grow(self, amount: int) -> None:
+        lo = len(self.table)
+        if amount < lo:
+            return
+        hi = max(amount + 1, 2 * lo)
+        table = self.table
+        table.extend(array('i', [UNREACHABLE]) * (hi - lo))
+        for c in self.coins:
+            for a in range(max(c, lo), hi):
+                cand = table[a - c] + 1
+                if cand < table[a]:
+                    table[a] = cand
+
+    def min_coins(self, amount: int) -> int:
+        self._grow(amount)
+        best = self.table[amount]
+        return -1 if best >= UNREACHABLE else best
+
+    def min_coins_many(self, amounts: list[int]) -> list[int]:
+        amounts = list(amounts)
+        if amounts:
+            self._grow(max(amounts))
+        table = self.table
+        return [-1 if table[a] >= UNREACHABLE else table[a] for a in amounts]
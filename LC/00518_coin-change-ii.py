@@ -1,11 +1,13 @@
 # topics: dp
 
-from functools import lru_cache 
+from array import array
+
+from algorithms.dp_stack import stack_dp
 
 class Solution:
     def change(self, amount: int, coins: list[int]) -> int:
         
-        @lru_cache(None)
+        @stack_dp(shape=(amount + 1, len(coins) + 1))
         def dp(pending_amount, i):
             if pending_amount == 0:
                 return 1
@@ -13,9 +15,53 @@ class Solution:
                 return 0
             
             count = 0
-            count += dp(pending_amount - coins[i], i)        
-            count += dp(pending_amount, i+1)
+            count += yield (pending_amount - coins[i], i)
+            count += yield (pending_amount, i+1)
             
             return count
         
-        return dp(amount,  0)
\ No newline at end of file
+        return dp(amount,  0)
+
+
+# --- one coin set, many amounts ---
+
+class CoinSet:
+    """
+    Bottom-up count-ways table shared by every query on the same denominations.
+    table[a] = number of combinations summing to a (coins in the outer loop, so
+    order doesn't matter). With `mod` the table is a fixed-width array('q') and
+    counts never grow into big ints.
+
+    Adding coins in the outer loop means a longer table can't be extended in
+    place, so it is rebuilt at (at least) double size: O(1) amortized rebuilds.
+    """
+    def __init__(self, coins: list[int], mod: int = 0):
+        self.coins = [c for c in coins if c > 0]
+        self.mod = mod
+        self.table = [1]
+
+    def _grow(self, amount: int) -> None:
+        if amount < len(self.table):
+            return
+        size = max(amount + 1, 2 * len(self.table))
+        mod = self.mod
+        table = array('q', [0]) * size if mod else [0] * size
+        table[0] = 1
+        for c in self.coins:
+            for a in range(c, size):
+                if mod:
+                    table[a] = (table[a] + table[a - c]) % mod
+                else:
+                    table[a] += table[a - c]
+        self.table = table
+
+    def ways(self, amount: int) -> int:
+        self._grow(amount)
+        return self.table[amount]
+
+    def ways_many(self, amounts: list[int]) -> list[int]:
+        amounts = list(amounts)
+        if amounts:
+            self._grow(max(amounts))
+        table = self.table
+        return [table[a] for a in amounts]
@@ -1,28 +1,6 @@
 # topics: graph, uf
 
-class UF:
-    def __init__(self, n: int):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, a: int, b: int) -> bool:
-        ra, rb = self.find(a), self.find(b)
-        if ra == rb:
-            return False
-        # Union by rank
-        if self.rank[ra] < self.rank[rb]:
-            self.parent[ra] = rb
-        elif self.rank[ra] > self.rank[rb]:
-            self.parent[rb] = ra
-        else:
-            self.parent[rb] = ra
-            self.rank[ra] += 1
-        return True
+from algorithms.union_find import UF
 
 class Solution:
     def findCircleNum(self, isConnected: list[list[int]]) -> int:
@@ -33,5 +11,4 @@ class Solution:
                 if isConnected[r][c] == 1:
                     uf.union(r, c)
 
-        roots = {uf.find(i) for i in range(n)}
-        return len(roots)
\ No newline at end of file
+        return uf.components
@@ -3,29 +3,56 @@
 """
 state: i, max points till index i of freq
 dp[i] = max(dp[i-1], dp[i-2]+points[i])
+
+compressed: the same recurrence over the sorted distinct values only; a gap
+of more than 1 between neighbours means taking one never deletes the other,
+so the chain restarts there. O(d log d) time and O(d) memory for d distinct
+values, whatever their magnitude.
 """
 
-from typing import List 
+from collections import Counter
+from typing import Dict, List 
 
 def deleteAndEarn(self, nums: List[int]) -> int:
     frequencies = {}
-    max_number = float('-inf')
+    max_number = 0
     for n in nums:
         max_number = max(max_number, n)
         if n in frequencies:
             frequencies[n] += 1
         else:
             frequencies[n] = 1
-    
-    points = [0] * (max_number +1 )
+
+    # a dense table only pays off while the values are small relative to the input
+    if max_number > 2 * len(frequencies) + 16:
+        return _earn_compressed(frequencies)
+
+    points = [0] * (max_number + 2)
     for k,v in frequencies.items():
         points[k] = v*k
 
     two_back = points[0]
-    one_back = points[1]
+    one_back = max(points[0], points[1])
     for i in range(2, max_number+1):
         curr = max(one_back, two_back + points[i])
         two_back = one_back
         one_back = curr
     
-    return curr
\ No newline at end of file
+    return one_back
+
+
+def delete_and_earn_compressed(nums: List[int]) -> int:
+    return _earn_compressed(Counter(nums))
+
+
+def _earn_compressed(frequencies: Dict[int, int]) -> int:
+    two_back = one_back = 0
+    prev = None
+    for k in sorted(frequencies):
+        gain = k * frequencies[k]
+        if prev is not None and k - prev == 1:
+            two_back, one_back = one_back, max(one_back, two_back + gain)
+        else:
+            two_back, one_back = one_back, one_back + gain
+        prev = k
+    return one_back
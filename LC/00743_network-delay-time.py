@@ -1,7 +1,8 @@
 # topics: graph, dijkstra
 
 import heapq
-from typing import List 
+from array import array
+from typing import Iterable, List, Optional
 from collections import defaultdict
 
 class Solution:
@@ -27,4 +28,72 @@ class Solution:
         ans = max(dist[1:])
         return ans if ans != float('inf') else -1
 
-        
\ No newline at end of file
+
+# --- compiled graph for many source queries on the same network ---
+
+INF = (1 << 62)
+
+class CSRGraph:
+    """
+    Directed graph compiled once from (u, v, w) edges on nodes 1..n into
+    offsets/targets/weights arrays; edges of u are targets[offsets[u]:offsets[u+1]].
+    """
+    def __init__(self, n: int, times: List[List[int]]):
+        self.n = n
+        counts = array('i', [0]) * (n + 2)
+        for u, _, _ in times:
+            counts[u + 1] += 1
+        for i in range(1, n + 2):
+            counts[i] += counts[i - 1]
+        self.offsets = array('i', counts)
+        self.targets = array('i', [0]) * len(times)
+        self.weights = array('q', [0]) * len(times)
+        fill = counts
+        for u, v, w in times:
+            i = fill[u]
+            self.targets[i] = v
+            self.weights[i] = w
+            fill[u] = i + 1
+
+    def dijkstra(self, sources: Iterable[int], targets: Optional[Iterable[int]] = None) -> array:
+        """
+        Shortest distances from the closest of `sources`; unreachable nodes stay INF.
+        With `targets`, stops as soon as every target is settled.
+        """
+        offsets, adj, weights = self.offsets, self.targets, self.weights
+        dist = array('q', [INF]) * (self.n + 1)
+        heap = []
+        for s in sources:
+            if dist[s]:
+                dist[s] = 0
+                heap.append((0, s))
+        remaining = None
+        if targets is not None:
+            remaining = set(targets)
+            if not remaining:
+                return dist
+        heappop, heappush = heapq.heappop, heapq.heappush
+
+        # heapq with lazy deletion: an entry is stale once dist[u] has dropped below it
+        while heap:
+            du, u = heappop(heap)
+            if du > dist[u]:
+                continue
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            for e in range(offsets[u], offsets[u + 1]):
+                nd = du + weights[e]
+                v = adj[e]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heappush(heap, (nd, v))
+        return dist
+
+    def network_delay(self, k: int) -> int:
+        ans = max(self.dijkstra((k,))[1:])
+        return ans if ans != INF else -1
+
+    def network_delay_many(self, sources: Iterable[int]) -> List[int]:
+        return [self.network_delay(k) for k in sources]
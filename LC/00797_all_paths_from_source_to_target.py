@@ -1,5 +1,8 @@
 # topics: graph, dfs
 
+from collections import deque
+from itertools import islice
+
 class Solution:
     def allPathsSourceTarget(self, graph: list[list[int]]) -> list[list[int]]:
         n = len(graph)
@@ -16,4 +19,115 @@ class Solution:
         
         dfs(0)
 
-        return paths        
\ No newline at end of file
+        return paths
+
+
+# --- lazy enumeration, counting and paging for DAGs with huge path counts ---
+
+def _reaches(graph: list[list[int]], target: int) -> bytearray:
+    # ok[v] = 1 if target is reachable from v (BFS over reversed edges)
+    radj = [[] for _ in graph]
+    for u, nbrs in enumerate(graph):
+        for v in nbrs:
+            radj[v].append(u)
+    ok = bytearray(len(graph))
+    ok[target] = 1
+    queue = deque([target])
+    while queue:
+        v = queue.popleft()
+        for u in radj[v]:
+            if not ok[u]:
+                ok[u] = 1
+                queue.append(u)
+    return ok
+
+def _walk(graph, ok, target, path, nxt):
+    # explicit-stack DFS; nxt[i] is the next neighbour index to try from path[i]
+    while path:
+        nbrs = graph[path[-1]]
+        i = nxt[-1]
+        while i < len(nbrs) and not ok[nbrs[i]]:
+            i += 1
+        if i == len(nbrs):
+            path.pop()
+            nxt.pop()
+            continue
+        nxt[-1] = i + 1
+        v = nbrs[i]
+        if v == target:
+            yield path + [v]
+            continue
+        path.append(v)
+        nxt.append(0)
+
+def iter_paths(graph: list[list[int]], source: int = 0, target: int = None):
+    """
+    Yield source -> target paths one at a time, in the same order as the
+    recursive DFS, skipping neighbours that can't reach the target.
+    """
+    if target is None:
+        target = len(graph) - 1
+    ok = _reaches(graph, target)
+    if not ok[source]:
+        return
+    if source == target:
+        yield [source]
+        return
+    yield from _walk(graph, ok, target, [source], [0])
+
+def count_paths_from(graph: list[list[int]], target: int = None) -> list[int]:
+    # ways[v] = number of v -> target paths, by DP in reverse topological order
+    n = len(graph)
+    if target is None:
+        target = n - 1
+    indeg = [0] * n
+    for nbrs in graph:
+        for v in nbrs:
+            indeg[v] += 1
+    order = [v for v in range(n) if indeg[v] == 0]
+    for u in order:
+        for v in graph[u]:
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                order.append(v)
+    if len(order) != n:
+        raise ValueError("graph has a cycle")
+
+    ways = [0] * n
+    for u in reversed(order):
+        ways[u] = 1 if u == target else sum(ways[v] for v in graph[u])
+    return ways
+
+def count_paths(graph: list[list[int]], source: int = 0, target: int = None) -> int:
+    return count_paths_from(graph, target)[source]
+
+def paths_page(graph: list[list[int]], start: int, size: int, source: int = 0, target: int = None) -> list[list[int]]:
+    """
+    Paths start .. start+size-1 in iter_paths order. Whole subtrees before
+    `start` are skipped using the path counts instead of being enumerated.
+    """
+    if target is None:
+        target = len(graph) - 1
+    ways = count_paths_from(graph, target)
+    if size <= 0 or start >= ways[source]:
+        return []
+    if source == target:
+        return [[source]]
+
+    path, nxt = [source], []
+    k = start
+    node = source
+    while True:
+        for i, v in enumerate(graph[node]):
+            if k < ways[v]:
+                break
+            k -= ways[v]
+        nxt.append(i + 1)
+        if v == target:
+            break
+        path.append(v)
+        node = v
+
+    first = path + [target]
+    ok = bytearray(1 if w else 0 for w in ways)
+    return [first] + list(islice(_walk(graph, ok, target, path, nxt), size - 1))
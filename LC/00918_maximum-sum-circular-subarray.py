@@ -1,5 +1,11 @@
 # topics: dp
 
+from itertools import accumulate, chain
+from operator import sub
+from typing import List
+
+from algorithms.chunked import reduce_chunks, reduce_file
+
 class Solution:
     def maxSubarraySumCircular(self, nums: List[int]) -> int:
         total_sum = 0
@@ -21,3 +27,53 @@ class Solution:
         outer_sum = total_sum - min_sum_center
         ans = max(max_sum_center, outer_sum)
         return ans
+
+
+# --- associative summaries: reduce chunks independently, merge exactly ---
+#
+# A chunk is summarized by (total, max_prefix, max_suffix, max_inner,
+# min_prefix, min_suffix, min_inner) over non-empty prefixes/suffixes/subarrays.
+# merge() is associative, so chunks can be reduced in any grouping (e.g. in a
+# process pool) and folded left to right.
+
+def circular_summary(chunk) -> tuple:
+    # every pass is accumulate/map/max/min, so the loops run in C
+    pre = list(accumulate(chunk))
+    total = pre[-1]
+    before = list(chain((0,), pre[:-1]))        # prefix sum before each element
+    return (
+        total,
+        max(pre),
+        total - min(before),
+        max(map(sub, pre, accumulate(before, min))),
+        min(pre),
+        total - max(before),
+        min(map(sub, pre, accumulate(before, max))),
+    )
+
+def merge_circular(a: tuple, b: tuple) -> tuple:
+    at, amp, ams, ami, anp, ans, ani = a
+    bt, bmp, bms, bmi, bnp, bns, bni = b
+    return (
+        at + bt,
+        max(amp, at + bmp),
+        max(bms, bt + ams),
+        max(ami, bmi, ams + bmp),
+        min(anp, at + bnp),
+        min(bns, bt + ans),
+        min(ani, bni, ans + bnp),
+    )
+
+def circular_answer(summary: tuple) -> int:
+    total, _, _, max_inner, _, _, min_inner = summary
+    if max_inner < 0:
+        return max_inner
+    return max(max_inner, total - min_inner)
+
+def max_subarray_sum_circular_chunks(chunks, workers: int = 1):
+    # chunks: non-empty sequences in order (lists, arrays, ...)
+    return circular_answer(reduce_chunks(chunks, circular_summary, merge_circular, workers))
+
+def max_subarray_sum_circular_file(path: str, typecode: str = 'q', workers: int = 1, chunk_items: int = 1 << 22):
+    """Same answer over a raw binary array file; each worker reads its own slice."""
+    return circular_answer(reduce_file(path, circular_summary, merge_circular, typecode, workers, chunk_items))
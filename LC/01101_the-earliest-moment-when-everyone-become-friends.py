@@ -1,35 +1,12 @@
 # topics: graph, uf
 
-class UF:
-    def __init__(self, n: int):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.components = n
-
-    def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, a: int, b: int) -> bool:
-        ra, rb = self.find(a), self.find(b)
-        if ra == rb:
-            return False  # no merge (already connected)
-
-        # union by rank
-        if self.rank[ra] < self.rank[rb]:
-            self.parent[ra] = rb
-        elif self.rank[ra] > self.rank[rb]:
-            self.parent[rb] = ra
-        else:
-            self.parent[rb] = ra
-            self.rank[ra] += 1
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from math import isqrt
 
-        self.components -= 1
-        return True  # merged
-
-    def all_connected(self) -> bool:
-        return self.components == 1
+from algorithms.union_find import UF
 
 class Solution:
     def earliestAcq(self, logs: list[list[int]], n: int) -> int:
@@ -41,4 +18,133 @@ class Solution:
             uf.union(i, j)
             if uf.all_connected():
                 return t
-        return -1
\ No newline at end of file
+        return -1
+
+
+# --- streaming: events arrive continuously and slightly out of order ---
+
+def read_events(path: str):
+    # one "t a b" event per line (commas or whitespace)
+    with open(path) as f:
+        for line in f:
+            parts = line.replace(",", " ").split()
+            if parts:
+                t, a, b = map(int, parts)
+                yield t, a, b
+
+def earliest_acq_stream(events, n: int, window: int = 1024, thresholds=()):
+    """
+    Consume (t, a, b) events from any iterator, holding at most `window`
+    of them in a min-heap reorder buffer. An event may arrive up to `window`
+    positions later than its timestamp order.
+
+    Returns (t_all_connected or -1, {threshold: t}) where the dict holds the
+    first time the component count dropped to <= threshold. Thresholds >= n
+    hold before any event, so there is no event time to report; they are
+    left out of the dict.
+    """
+    uf = UF(n)
+    pending = sorted({c for c in thresholds if c < n}, reverse=True)
+    crossed = {}
+    buffer = []
+    last_t = None
+
+    def apply(t, a, b):
+        if uf.union(a, b):
+            while pending and uf.components <= pending[0]:
+                crossed[pending.pop(0)] = t
+        return uf.all_connected()
+
+    for t, a, b in events:
+        if last_t is not None and t < last_t:
+            raise ValueError(f"event at t={t} arrived after t={last_t} was applied; increase window")
+        heapq.heappush(buffer, (t, a, b))
+        if len(buffer) > window:
+            t0, a0, b0 = heapq.heappop(buffer)
+            last_t = t0
+            if apply(t0, a0, b0):
+                return t0, crossed
+
+    while buffer:
+        t0, a0, b0 = heapq.heappop(buffer)
+        if apply(t0, a0, b0):
+            return t0, crossed
+    return -1, crossed
+
+
+# --- offline time-window queries: were a and b connected using only events in [t1, t2]? ---
+
+class RollbackUF:
+    # union by size, no path compression, so every union can be undone
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.history = []
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        self.history.append(rb)
+        return True
+
+    def snapshot(self) -> int:
+        return len(self.history)
+
+    def rollback(self, snap: int) -> None:
+        parent, size, history = self.parent, self.size, self.history
+        while len(history) > snap:
+            rb = history.pop()
+            ra = parent[rb]
+            size[ra] -= size[rb]
+            parent[rb] = rb
+
+def connected_during(logs: list[list[int]], n: int, queries) -> list[bool]:
+    """
+    Answer queries (t1, t2, a, b) offline. Events are sorted once; queries are
+    bucketed by the sqrt-block of their first event (Mo's order) so the part of
+    each window past the block boundary is shared between queries, and only the
+    in-block prefix is unioned and rolled back per query.
+    """
+    events = sorted(logs, key=lambda x: x[0])
+    times = [e[0] for e in events]
+    block = max(1, isqrt(len(events)))
+
+    ans = [False] * len(queries)
+    buckets = defaultdict(list)
+    for qi, (t1, t2, a, b) in enumerate(queries):
+        if a == b:
+            ans[qi] = True
+            continue
+        l, r = bisect_left(times, t1), bisect_right(times, t2)  # events[l:r]
+        if l < r:
+            buckets[l // block].append((r, l, a, b, qi))
+
+    uf = RollbackUF(n)
+    for blk, qs in buckets.items():
+        uf.rollback(0)
+        block_end = (blk + 1) * block
+        cur = block_end
+        qs.sort()
+        for r, l, a, b, qi in qs:
+            while cur < r:  # shared suffix, only grows
+                _, x, y = events[cur]
+                uf.union(x, y)
+                cur += 1
+            snap = uf.snapshot()
+            for e in range(l, min(r, block_end)):
+                _, x, y = events[e]
+                uf.union(x, y)
+            ans[qi] = uf.find(a) == uf.find(b)
+            uf.rollback(snap)
+    return ans
@@ -22,3 +22,60 @@ def tribonacci(self, n: int) -> int:
     
     return current
 
+
+# --- O(k^2 log n) n-th term of any linear recurrence (Kitamasa) ---
+
+class LinearRecurrence:
+    """
+    a[n] = coeffs[0] * a[n-1] + ... + coeffs[k-1] * a[n-k], with a[0..k-1] = initial.
+
+    a[n] = sum(r[j] * a[j]) where r = x^n mod (x^k - coeffs[0] x^(k-1) - ... - coeffs[k-1]).
+    x^(2^b) mod that polynomial is cached, so each term is one multiplication per
+    set bit of n, and a batch of terms shares all the squarings.
+    """
+    def __init__(self, coeffs: list[int], initial: list[int], mod: int = 0):
+        if len(coeffs) != len(initial) or not coeffs:
+            raise ValueError("need k coefficients and k initial terms, k >= 1")
+        self.coeffs = coeffs
+        self.initial = initial
+        self.k = len(coeffs)
+        self.mod = mod
+        self.pow2 = [self._reduce([0, 1])]  # x^(2^0)
+
+    def _reduce(self, poly: list[int]) -> list[int]:
+        # x^d = x^(d-k) * (coeffs[0] x^(k-1) + ... + coeffs[k-1]) for d >= k
+        k, coeffs, mod = self.k, self.coeffs, self.mod
+        poly = poly + [0] * max(0, k - len(poly))
+        for d in range(len(poly) - 1, k - 1, -1):
+            t = poly[d]
+            if t:
+                for i, c in enumerate(coeffs, 1):
+                    poly[d - i] += t * c
+        poly = poly[:k]
+        return [p % mod for p in poly] if mod else poly
+
+    def _mul(self, a: list[int], b: list[int]) -> list[int]:
+        prod = [0] * (2 * self.k - 1)
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    prod[i + j] += x * y
+        return self._reduce(prod)
+
+    def term(self, n: int) -> int:
+        if n < self.k:
+            return self.initial[n] % self.mod if self.mod else self.initial[n]
+        while len(self.pow2) < n.bit_length():
+            self.pow2.append(self._mul(self.pow2[-1], self.pow2[-1]))
+        r = None
+        for b in range(n.bit_length()):
+            if (n >> b) & 1:
+                r = self.pow2[b] if r is None else self._mul(r, self.pow2[b])
+        total = sum(x * a for x, a in zip(r, self.initial))
+        return total % self.mod if self.mod else total
+
+    def terms(self, ns: list[int]) -> list[int]:
+        return [self.term(n) for n in ns]
+
+def tribonacci_fast(n: int, mod: int = 0) -> int:
+    return LinearRecurrence([1, 1, 1], [0, 1, 1], mod).term(n)
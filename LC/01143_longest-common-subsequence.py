@@ -4,20 +4,81 @@ state: i,j the index i and j from text1 and text2
 dp[i,j] = the max common starting from index i,j
 """
 
-from functools import lru_cache
+from algorithms.dp_stack import stack_dp
 
 def longestCommonSubsequence(self, text1: str, text2: str) -> int:
     m = len(text1)
     n = len(text2)
 
-    @lru_cache(None)
+    @stack_dp(shape=(m + 1, n + 1))
     def dp(i, j):
         if i == m or j == n:
             return 0
         
         if text1[i] == text2[j]:
-            return 1 + dp(i+1, j+1)
+            return 1 + (yield (i+1, j+1))
         
-        return max(dp(i+1, j), dp(i, j+1))
+        return max((yield (i+1, j)), (yield (i, j+1)))
     
-    return dp(0,0)
\ No newline at end of file
+    return dp(0,0)
+
+# --- long inputs: no recursion, no O(m*n) cache ---
+
+def lcs_length_rolling(text1: str, text2: str) -> int:
+    # bottom-up, one row over the shorter string: O(min(m, n)) memory
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    prev = [0] * (len(text2) + 1)
+    for ch in text1:
+        cur = [0]
+        for j, other in enumerate(text2):
+            cur.append(prev[j] + 1 if ch == other else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+def lcs_length_bits(text1: str, text2: str) -> int:
+    """
+    Bit-parallel LCS (Allison-Dix / Hyyro). Match masks of the longer string are
+    packed into Python ints, so each character of the shorter one costs a few
+    big-int ops over len/64 machine words instead of an inner Python loop.
+    """
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    m = len(text1)
+    masks = {}
+    for i, ch in enumerate(text1):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+
+    full = (1 << m) - 1
+    v = full
+    for ch in text2:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return m - v.bit_count()
+
+def _lcs_last_row(a, b) -> list[int]:
+    prev = [0] * (len(b) + 1)
+    for ch in a:
+        cur = [0]
+        for j, other in enumerate(b):
+            cur.append(prev[j] + 1 if ch == other else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev
+
+def lcs_string(text1: str, text2: str) -> str:
+    """
+    Hirschberg: split text1 in half, find where the optimal path crosses the middle
+    using one forward and one reversed row, and recurse on both halves.
+    O(m*n) time, O(m + n) memory, recursion depth O(log m).
+    """
+    if not text1 or not text2:
+        return text1[:0]
+    if len(text1) == 1:
+        return text1 if text1[0] in text2 else text1[:0]
+
+    mid = len(text1) // 2
+    left = _lcs_last_row(text1[:mid], text2)
+    right = _lcs_last_row(text1[mid:][::-1], text2[::-1])
+    n = len(text2)
+    split = max(range(n + 1), key=lambda k: left[k] + right[n - k])
+    return lcs_string(text1[:mid], text2[:split]) + lcs_string(text1[mid:], text2[split:])
@@ -1,37 +1,17 @@
 # topics: graph, uf
 
+import mmap
+from array import array
 from collections import defaultdict
 from typing import List
 
-class UF:
-    def __init__(self, n: int):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, a: int, b: int) -> bool:
-        ra, rb = self.find(a), self.find(b)
-        if ra == rb:
-            return False
-        if self.rank[ra] < self.rank[rb]:
-            self.parent[ra] = rb
-        elif self.rank[ra] > self.rank[rb]:
-            self.parent[rb] = ra
-        else:
-            self.parent[rb] = ra
-            self.rank[ra] += 1
-        return True
+from algorithms.union_find import UF
 
 class Solution:
     def smallestStringWithSwaps(self, s: str, pairs: List[List[int]]) -> str:
         n = len(s)
         uf = UF(n)
-        for i, j in pairs:
-            uf.union(i, j)
+        uf.union_many(pairs)
 
         # 1) Group indices by component root
         comp = defaultdict(list)
@@ -48,4 +28,50 @@ class Solution:
             for i, ch in zip(idxs, chars):
                 res[i] = ch
 
-        return "".join(res)
\ No newline at end of file
+        return "".join(res)
+
+
+# --- bytes-native version for multi-megabyte inputs ---
+
+def smallest_bytes_with_swaps(data, pairs) -> bytearray:
+    """
+    Same answer on bytes / bytearray / memoryview input, without one str object
+    per character or one list per component.
+
+    Both orderings are single C-level sorts over all components at once:
+    `members` lists indices grouped by root (ascending index within a root,
+    sorted is stable), and `ordered` the bytes grouped by root (ascending byte
+    within a root, via the packed key root << 8 | byte). Slot k of one belongs
+    to the same component as slot k of the other, so index members[k] gets
+    byte ordered[k].
+    """
+    n = len(data)
+    uf = UF(n)
+    uf.union_many(pairs)
+    roots = array('i', map(uf.find, range(n)))
+
+    keys = [r << 8 | b for r, b in zip(roots, data)]
+    keys.sort()
+    ordered = bytes([key & 255 for key in keys])
+    del keys
+    members = array('i', sorted(range(n), key=roots.__getitem__))
+
+    out = bytearray(n)
+    for i, b in zip(members, ordered):
+        out[i] = b
+    return out
+
+def smallest_string_with_swaps(s: str, pairs) -> str:
+    # latin-1 maps U+0000..U+00FF to the byte of the same value, so byte order is character order
+    try:
+        data = s.encode("latin-1")
+    except UnicodeEncodeError:
+        return Solution().smallestStringWithSwaps(s, pairs)
+    return smallest_bytes_with_swaps(data, pairs).decode("latin-1")
+
+def smallest_file_with_swaps(path: str, pairs) -> str:
+    # one character per byte of the file; iterating an mmap gives 1-byte
+    # bytes objects, a memoryview over it gives ints
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return smallest_bytes_with_swaps(view, pairs).decode("latin-1")
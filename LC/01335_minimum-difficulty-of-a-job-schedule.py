@@ -1,6 +1,9 @@
 # topics: dp
 
-from functools import lru_cache
+from array import array
+from itertools import accumulate
+
+from algorithms.dp_memo import memo
 
 class Solution:
     def minDifficulty(self, jobDifficulty: list[int], d: int) -> int:
@@ -8,7 +11,7 @@ class Solution:
         if n < d:
             return -1
 
-        @lru_cache(None)
+        @memo(shape=(n + 1, d + 1))
         def dp(i: int, day: int) -> int:
             if day == d:
                 return max(jobDifficulty[i:])
@@ -23,4 +26,59 @@ class Solution:
                 best = min(best, today_max + dp(j + 1, day + 1))
             return best
 
-        return dp(0, 1)
\ No newline at end of file
+        return dp(0, 1)
+
+
+# --- bottom-up O(n * d) with a monotonic stack, plus the schedule itself ---
+
+INF = 1 << 62
+
+def min_difficulty_schedule(jobDifficulty: list[int], d: int):
+    """
+    prev[i] = best cost of jobs 0..i in (day - 1) days. For day `day`, the stack
+    holds indices with decreasing difficulty; each entry j also keeps low[j], the
+    cheapest prev[s - 1] over the block starts s for which jobDifficulty[j] is the
+    block maximum. Popping merges those starts into i, so each layer is amortized
+    O(n). Day 1 is just the prefix maximum.
+
+    Returns (cost, starts) where starts[k] is the first job of day k + 1,
+    or (-1, []) if there are fewer jobs than days.
+    """
+    a = jobDifficulty
+    n = len(a)
+    if n < d or d == 0:
+        return -1, []
+
+    prev = array('q', accumulate(a, max))
+    day_start = []  # day_start[k][i]: first job of the last day when jobs 0..i fill k + 2 days
+    for day in range(1, d):
+        cur = array('q', [INF]) * n
+        start = array('i', [0]) * n
+        low = array('q', [INF]) * n
+        low_start = array('i', [0]) * n
+        stack = []
+        for i in range(day, n):
+            best, best_start = prev[i - 1], i
+            while stack and a[stack[-1]] <= a[i]:
+                j = stack.pop()
+                if low[j] < best:
+                    best, best_start = low[j], low_start[j]
+            low[i], low_start[i] = best, best_start
+            cur[i], start[i] = best + a[i], best_start
+            if stack and cur[stack[-1]] < cur[i]:
+                cur[i], start[i] = cur[stack[-1]], start[stack[-1]]
+            stack.append(i)
+        day_start.append(start)
+        prev = cur
+
+    starts = []
+    end = n - 1
+    for start in reversed(day_start):
+        starts.append(start[end])
+        end = start[end] - 1
+    starts.append(0)
+    starts.reverse()
+    return prev[n - 1], starts
+
+def min_difficulty(jobDifficulty: list[int], d: int) -> int:
+    return min_difficulty_schedule(jobDifficulty, d)[0]
@@ -2,12 +2,15 @@
 
 from typing import List 
 from functools import lru_cache
+
+from algorithms.dp_memo import memo
+
 class Solution:
     def maxStudents(self, seats: List[List[str]]) -> int:
         m = len(seats)
         n = len(seats[0])
 
-        @lru_cache(None)
+        @memo(shape=(m + 1, 1 << n), typecode='i')
         def dp(i, mask):
             if i == m:
                 return 0
@@ -38,4 +41,89 @@ class Solution:
             return val
         
         return dp(0, 0)
-        
\ No newline at end of file
+
+
+# --- many floor plans: per-row mask tables + rolling DP ---
+
+@lru_cache(None)
+def _row_options(row_mask: int):
+    # seat masks inside this row with no two students side by side, and their popcounts
+    masks = []
+    sub = row_mask
+    while True:
+        if sub & (sub << 1) == 0:
+            masks.append(sub)
+        if sub == 0:
+            break
+        sub = (sub - 1) & row_mask
+    return tuple(masks), tuple(m.bit_count() for m in masks)
+
+@lru_cache(None)
+def _compatible(prev_row_mask: int, row_mask: int):
+    # for each option of this row, the indices of previous-row options with no diagonal neighbour
+    prev_masks, _ = _row_options(prev_row_mask)
+    masks, _ = _row_options(row_mask)
+    return tuple(
+        tuple(p for p, pm in enumerate(prev_masks) if cur & ((pm << 1) | (pm >> 1)) == 0)
+        for cur in masks
+    )
+
+def _row_mask(row) -> int:
+    mask = 0
+    for idx, col in enumerate(row):
+        if col == ".":
+            mask |= 1 << idx
+    return mask
+
+def max_students_rows(seats: List[List[str]]) -> int:
+    """
+    Bottom-up over rows, keeping only the previous row's values. Valid masks and
+    the row-to-row compatibility lists are cached by the rows' seat masks, so
+    they are shared by every floor plan with the same row shapes.
+    """
+    prev_mask, prev = 0, [0]
+    for row in seats:
+        mask = _row_mask(row)
+        _, counts = _row_options(mask)
+        compat = _compatible(prev_mask, mask)
+        prev = [counts[c] + max(prev[p] for p in compat[c]) for c in range(len(counts))]
+        prev_mask = mask
+    return max(prev)
+
+def max_students_profile(seats: List[List[str]]) -> int:
+    """
+    Broken-profile DP, one cell at a time. The profile holds the last n + 1 cells
+    placed, in reading order: bit 0 = left neighbour, bit n - 2 = upper-right,
+    bit n = upper-left. Only reachable profiles are stored, which keeps wide rooms
+    (n around 16-20) tractable.
+    """
+    n = len(seats[0])
+    keep = (1 << (n + 1)) - 1
+    upper_left = 1 << n
+    upper_right = 1 << (n - 2) if n >= 2 else 0
+    states = {0: 0}
+    for row in seats:
+        for j, col in enumerate(row):
+            blocked = 0
+            if j > 0:
+                blocked |= 1 | upper_left
+            if j + 1 < n:
+                blocked |= upper_right
+            nxt = {}
+            for profile, val in states.items():
+                key = (profile << 1) & keep
+                if nxt.get(key, -1) < val:
+                    nxt[key] = val
+                if col == "." and not profile & blocked:
+                    key |= 1
+                    if nxt.get(key, -1) < val + 1:
+                        nxt[key] = val + 1
+            states = nxt
+    return max(states.values())
+
+def max_students(seats: List[List[str]]) -> int:
+    if not seats or not seats[0]:
+        return 0
+    if len(seats[0]) <= 10:
+        return max_students_rows(seats)
+    return max_students_profile(seats)
@@ -4,22 +4,60 @@ state: i,m which say i numbers used and m multiples used.
 dp[i,m]: max score by starting from i and m
 """
 
-from functools import lru_cache
 from typing import List
 
+from algorithms.dp_stack import stack_dp
+
 def maximumScore(self, nums: List[int], multipliers: List[int]) -> int:
     n = len(nums)
     m = len(multipliers)
 
-    @lru_cache(None)
+    @stack_dp(shape=(m + 1, m + 1))
     def dp(i, j):
         if j == m:
             return 0
         
         right = (n-1) - (j-i)
-        picking_left = nums[i] * multipliers[j] + dp(i+1, j+1)
-        picking_right = nums[right] * multipliers[j] + dp(i, j+1)
+        picking_left = nums[i] * multipliers[j] + (yield (i+1, j+1))
+        picking_right = nums[right] * multipliers[j] + (yield (i, j+1))
 
         return max(picking_left, picking_right)
             
-    return dp(0, 0)
\ No newline at end of file
+    return dp(0, 0)
+
+# --- bottom-up, one O(m) row at a time ---
+
+def maximum_score_rows(nums: List[int], multipliers: List[int], traceback: bool = False):
+    """
+    Same dp, filled for j = m-1 .. 0 keeping only row j+1. Row j has j+1 entries
+    (i = 0..j); the left candidates use nums[0..j] and the right ones nums[n-1-j..n-1],
+    so each row is one zip over slices instead of per-state recursion.
+
+    With traceback, the left/right choice of every state is bit-packed into one
+    int per row (bit i set = take left), O(m^2 / 8) bytes in total, and the
+    picks are returned as a string of 'L'/'R'.
+    """
+    n, m = len(nums), len(multipliers)
+    nxt = [0] * (m + 1)
+    decisions = [0] * m if traceback else None
+
+    for j in range(m - 1, -1, -1):
+        x = multipliers[j]
+        lefts = [l * x + a for l, a in zip(nums[:j + 1], nxt[1:j + 2])]
+        rights = [r * x + b for r, b in zip(nums[n - 1 - j:n], nxt[:j + 1])]
+        nxt = list(map(max, lefts, rights))
+        if traceback:
+            bits = "".join("1" if l >= r else "0" for l, r in zip(lefts, rights))
+            decisions[j] = int(bits[::-1], 2)
+
+    if not traceback:
+        return nxt[0]
+    picks = []
+    i = 0
+    for j in range(m):
+        if (decisions[j] >> i) & 1:
+            picks.append("L")
+            i += 1
+        else:
+            picks.append("R")
+    return nxt[0], "".join(picks)
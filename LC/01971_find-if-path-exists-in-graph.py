@@ -1,6 +1,10 @@
-# topics: graph, dfs
+# topics: graph, dfs, uf
 
+from array import array
 from collections import defaultdict
+from operator import eq
+
+from algorithms.union_find import UF
 
 class Solution:
     def validPath(self, n: int, edges: list[list[int]], source: int, destination: int) -> bool:
@@ -26,4 +30,71 @@ class Solution:
                 visited.add(nei)
                 
         return False
-        
\ No newline at end of file
+
+
+# --- many pair queries against one snapshot ---
+
+class ReachabilityIndex:
+    """
+    Component label per node, computed once with union-find into an array('i').
+    Two nodes are connected iff their labels match, so each query is two lookups.
+    """
+    def __init__(self, n: int, edges: list[list[int]]):
+        uf = UF(n)
+        uf.union_many(edges)
+        self.labels = array('i', map(uf.find, range(n)))
+        self.components = uf.components
+
+    def connected(self, source: int, destination: int) -> bool:
+        return self.labels[source] == self.labels[destination]
+
+    def connected_many(self, sources, destinations) -> list[bool]:
+        # the gather and compare run in map/eq, not a Python-level loop body
+        get = self.labels.__getitem__
+        return list(map(eq, map(get, sources), map(get, destinations)))
+
+    def connected_pairs(self, pairs) -> list[bool]:
+        labels = self.labels
+        return [labels[a] == labels[b] for a, b in pairs]
+
+
+# --- single ad-hoc query on a huge graph ---
+
+def valid_path_bidirectional(n: int, edges: list[list[int]], source: int, destination: int) -> bool:
+    """
+    Grow a BFS frontier from both ends, always expanding the smaller one, and stop
+    as soon as they meet. Adjacency is CSR (offsets/targets arrays).
+    """
+    if source == destination:
+        return True
+    offsets = array('i', [0]) * (n + 1)
+    for a, b in edges:
+        offsets[a] += 1
+        offsets[b] += 1
+    total = 0
+    for i in range(n + 1):
+        offsets[i], total = total, total + offsets[i]
+    targets = array('i', [0]) * offsets[n]
+    fill = array('i', offsets)
+    for a, b in edges:
+        targets[fill[a]] = b
+        fill[a] += 1
+        targets[fill[b]] = a
+        fill[b] += 1
+
+    side = bytearray(n)  # 0 unseen, 1 reached from source, 2 from destination
+    side[source], side[destination] = 1, 2
+    frontiers = {1: [source], 2: [destination]}
+    while frontiers[1] and frontiers[2]:
+        mark = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+        nxt = []
+        for u in frontiers[mark]:
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                if side[v] == 0:
+                    side[v] = mark
+                    nxt.append(v)
+                elif side[v] != mark:
+                    return True
+        frontiers[mark] = nxt
+    return False
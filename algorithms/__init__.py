@@ -0,0 +1,16 @@
+"""
+Importable front end for the solutions under LC/ and wild/.
+
+    import algorithms
+    algorithms.get("00743")(times, n, k)
+    algorithms.get(743)(times, n, k)      # same thing
+    algorithms.get("743:csr")(n, times, k)  # compiled-graph engine, see registry.ENGINES
+
+Solution files are imported lazily, on first use of their id. The batch runner
+lives in `python -m algorithms` (see algorithms/__main__.py). Shared pieces the
+solutions import live here too: union_find, dp_memo and dp_stack.
+"""
+
+from .registry import get, normalize, problems
+
+__all__ = ["get", "normalize", "problems"]
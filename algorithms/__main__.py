@@ -0,0 +1,114 @@
+"""
+Stream JSONL problem instances through the solutions, in a process pool.
+
+Each input line is one task:
+
+    {"id": 7, "problem": "00743", "args": [[[2, 1, 1], [2, 3, 1], [3, 4, 1]], 4, 2]}
+
+and produces one output line, in input order:
+
+    {"id": 7, "problem": "00743", "result": 2}
+    {"id": 8, "problem": "00091", "error": "TaskTimeout: exceeded 1.0s"}
+
+    python -m algorithms tasks.jsonl -o results.jsonl --workers 8 --timeout 2
+
+Lines are parsed and results serialized inside the workers, and tasks are sent
+in chunks of --chunk-size. Pool.imap would read the whole input ahead, so the
+feeder blocks once a fixed number of tasks are in flight and resumes as results
+are written: memory stays flat on inputs with millions of lines and the pool
+never drains between batches. The per-task timeout uses SIGALRM, so
+it's only enforced on Unix, and only between Python bytecodes.
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import signal
+import sys
+import threading
+
+from .registry import get, normalize
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+_timeout = None
+
+
+def _on_alarm(signum, frame):
+    raise TaskTimeout(f"exceeded {_timeout:g}s")
+
+
+def _init_worker(timeout) -> None:
+    global _timeout
+    _timeout = timeout
+    if timeout and hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+
+def run_line(line: str) -> str:
+    record = {}
+    try:
+        task = json.loads(line)
+        record = {"id": task.get("id"), "problem": task.get("problem")}
+        fn = get(normalize(task["problem"]))
+        if _timeout and hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_REAL, _timeout)
+        try:
+            record["result"] = fn(*task.get("args", ()), **task.get("kwargs", {}))
+        finally:
+            if _timeout and hasattr(signal, "setitimer"):
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except Exception as exc:  # report and keep going; one bad task mustn't stop the batch
+        record.pop("result", None)
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    try:
+        return json.dumps(record)
+    except (TypeError, ValueError):
+        record["result"] = repr(record["result"])
+        return json.dumps(record)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m algorithms", description=__doc__.split("\n\n")[0])
+    parser.add_argument("input", nargs="?", default="-", help="JSONL tasks (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL results (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=64, help="tasks sent to a worker at a time")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per task")
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.input == "-" else open(args.input)
+    dst = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        lines = (line for line in src if line.strip())
+        if args.workers <= 1:
+            _init_worker(args.timeout)
+            for line in lines:
+                dst.write(run_line(line) + "\n")
+        else:
+            # at least one full chunk per worker in flight, plus the same again queued
+            in_flight = threading.Semaphore(args.workers * args.chunk_size * 2)
+
+            def feed():
+                for line in lines:
+                    in_flight.acquire()
+                    yield line
+
+            with mp.Pool(args.workers, initializer=_init_worker, initargs=(args.timeout,)) as pool:
+                for out in pool.imap(run_line, feed(), args.chunk_size):
+                    dst.write(out + "\n")
+                    in_flight.release()
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
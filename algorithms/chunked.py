@@ -0,0 +1,58 @@
+"""
+Fold an associative chunk summary over a sequence too big to handle at once.
+
+The chunked solutions (LC 121, 918) describe a chunk by a small summary tuple
+and combine neighbours with an associative merge(). These drivers do the
+reading and the (optionally parallel) reduce:
+
+    reduce_chunks(chunks, profit_summary, merge_profit, workers=4)
+    reduce_file("prices.bin", profit_summary, merge_profit, typecode='q')
+
+Both raise ValueError on empty input; there is no summary of nothing.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+
+
+def reduce_chunks(chunks, summarize, merge, workers: int = 1):
+    # chunks: non-empty sequences in order (lists, arrays, ...)
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            return _fold(merge, pool.map(summarize, chunks))
+    return _fold(merge, map(summarize, chunks))
+
+
+def _fold(merge, summaries):
+    summaries = iter(summaries)
+    first = next(summaries, None)
+    if first is None:
+        raise ValueError("no input to summarize")
+    return reduce(merge, summaries, first)
+
+
+def _summarize_slice(summarize, path: str, typecode: str, start: int, stop: int):
+    # reads items [start, stop) of a flat binary file of `typecode` values
+    values = array(typecode)
+    with open(path, "rb") as f:
+        f.seek(start * values.itemsize)
+        values.frombytes(f.read((stop - start) * values.itemsize))
+    return summarize(values)
+
+
+def reduce_file(path: str, summarize, merge, typecode: str = 'q', workers: int = 1,
+                chunk_items: int = 1 << 22):
+    """Same fold over a raw binary array file; each worker reads its own slice."""
+    count = os.path.getsize(path) // array(typecode).itemsize
+    if not count:
+        raise ValueError(f"{path} holds no {typecode!r} values")
+    starts = range(0, count, chunk_items)
+    args = ([path] * len(starts), [typecode] * len(starts), starts,
+            [min(s + chunk_items, count) for s in starts])
+    read = partial(_summarize_slice, summarize)
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            return _fold(merge, pool.map(read, *args))
+    return _fold(merge, map(read, *args))
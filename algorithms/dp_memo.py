@@ -0,0 +1,363 @@
+"""
+Instrumented, bounded memoization for the top-down DPs in LC/ and wild/.
+
+`lru_cache(None)` keeps one dict entry per state (a key tuple plus the dict
+slot, roughly 100+ bytes each), never says how many states a run touched, and
+grows until the process dies. `memo` is a decorator for those `dp(...)`
+functions that:
+
+- stores dense integer states in one preallocated flat slot per state,
+  indexed by the state's coordinates (`shape`), with an optional array typecode
+  so int/bool results take 1-8 bytes instead of a pointer;
+- falls back to a dict for states outside `shape` (or when no shape is given);
+- counts hits, misses, distinct states, peak entries (the most states held at
+  once, across `cache_clear()` calls) and approximate bytes;
+- enforces `max_bytes`: the dense table is checked before it's allocated, and
+  once the dict part would pass the cap it either raises `MemoBudgetExceeded`
+  or, with `spill=path`, moves further entries to an on-disk shelf, which
+  `cache_clear()` closes and deletes.
+
+    @memo(shape=(m + 1, n + 1), typecode='i')
+    def dp(i, j):
+        ...
+    dp(0, 0)
+    dp.cache_info()   # MemoInfo(hits=..., misses=..., states=..., ...)
+
+`estimate_bytes(shape, typecode)` gives the dense table size before a run.
+
+It is not a drop-in for `lru_cache` on deep recursions: the wrapper is a
+Python frame, so every state costs two frames against the recursion limit.
+On 3.12+, where lru_cache's C wrapper doesn't count, a chain DP reaches about
+half the depth it did (~500 vs ~990 states at the default limit). For long
+dependency chains use `algorithms.dp_stack.stack_dp`, which shares this store.
+"""
+
+import os
+import shelve
+import sys
+from array import array
+from functools import wraps
+from math import prod
+from typing import NamedTuple, Optional, Tuple
+
+
+class MemoBudgetExceeded(MemoryError):
+    pass
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    states: int
+    peak_entries: int
+    dense_bytes: int
+    sparse_bytes: int
+    spilled: int
+
+    @property
+    def approx_bytes(self) -> int:
+        return self.dense_bytes + self.sparse_bytes
+
+
+_MISSING = object()
+_POINTER = 8  # one list slot
+
+
+def estimate_bytes(shape: Tuple[int, ...], typecode: Optional[str] = None) -> int:
+    """Bytes for a dense table of `shape` (plus the 1-byte filled flag with a typecode)."""
+    cells = prod(shape)
+    if typecode is None:
+        return cells * _POINTER
+    return cells * (array(typecode).itemsize + 1)
+
+
+def _flattener(shape):
+    # args -> row-major flat index, or -1 if the state isn't inside `shape`
+    if shape is None:
+        return lambda args: -1
+    if len(shape) == 1:
+        (d0,) = shape
+
+        def index(args):
+            if len(args) == 1:
+                i = args[0]
+                if type(i) is int and 0 <= i < d0:
+                    return i
+            return -1
+    elif len(shape) == 2:
+        d0, d1 = shape
+
+        def index(args):
+            if len(args) == 2:
+                i, j = args
+                if type(i) is int and type(j) is int and 0 <= i < d0 and 0 <= j < d1:
+                    return i * d1 + j
+            return -1
+    elif len(shape) == 3:
+        d0, d1, d2 = shape
+
+        def index(args):
+            if len(args) == 3:
+                i, j, k = args
+                if (type(i) is int and type(j) is int and type(k) is int
+                        and 0 <= i < d0 and 0 <= j < d1 and 0 <= k < d2):
+                    return (i * d1 + j) * d2 + k
+            return -1
+    else:
+        dims = tuple(zip(shape, _strides(shape)))
+
+        def index(args):
+            if len(args) != len(dims):
+                return -1
+            flat = 0
+            for a, (dim, stride) in zip(args, dims):
+                if type(a) is not int or not 0 <= a < dim:
+                    return -1
+                flat += a * stride
+            return flat
+    return index
+
+
+def _strides(shape):
+    strides = []
+    step = 1
+    for dim in reversed(shape):
+        strides.append(step)
+        step *= dim
+    return strides[::-1]
+
+
+class _Store:
+    def __init__(self, shape, typecode, max_bytes, spill):
+        self.shape = tuple(shape) if shape else None
+        self.typecode = typecode
+        self.max_bytes = max_bytes
+        self.spill_path = spill
+        self.index = _flattener(self.shape)
+        self.strides = _strides(self.shape) if self.shape else None
+        self.peak = self.spilled = self.dense_bytes = 0
+        self.dense = self.filled = None
+        self.sparse = {}
+        self.shelf = None
+        self.clear()
+
+    def clear(self) -> None:
+        if self.shelf is not None:
+            self.shelf.close()
+            # flag="n" created it for this run; dbm backends may add a suffix
+            for suffix in ("", ".db", ".dat", ".dir", ".bak"):
+                try:
+                    os.remove(self.spill_path + suffix)
+                except FileNotFoundError:
+                    pass
+        self.peak = max(self.peak, self.states)
+        self.hits = self.misses = self.spilled = 0
+        # the tables are reset in place: the memo wrappers hold on to them
+        self.sparse.clear()
+        self.sparse_bytes = sys.getsizeof(self.sparse)
+        self.shelf = None
+        if self.dense is not None:
+            if self.filled is None:
+                self.dense[:] = [_MISSING] * len(self.dense)
+            else:
+                self.filled[:] = bytes(len(self.filled))
+        elif self.shape:
+            need = estimate_bytes(self.shape, self.typecode)
+            if self.max_bytes is not None and need > self.max_bytes:
+                raise MemoBudgetExceeded(
+                    f"dense memo table {self.shape} needs ~{need:,} bytes, cap is {self.max_bytes:,}")
+            cells = prod(self.shape)
+            if self.typecode is None:
+                self.dense = [_MISSING] * cells
+            else:
+                self.dense = array(self.typecode, [0]) * cells
+                self.filled = bytearray(cells)
+            self.dense_bytes = need
+
+    def get(self, key, flat):
+        if flat >= 0:
+            if self.filled is None:
+                return self.dense[flat]
+            return self.dense[flat] if self.filled[flat] else _MISSING
+        value = self.sparse.get(key, _MISSING)
+        if value is _MISSING and self.shelf is not None:
+            value = self.shelf.get(repr(key), _MISSING)
+        return value
+
+    def put(self, key, flat, value) -> None:
+        if flat >= 0:
+            self.dense[flat] = value
+            if self.filled is not None:
+                self.filled[flat] = 1
+        elif self.max_bytes is None:
+            self.sparse[key] = value
+        else:
+            cost = _entry_bytes(key, value)
+            if self.dense_bytes + self.sparse_bytes + cost > self.max_bytes:
+                if self.spill_path is None:
+                    raise MemoBudgetExceeded(
+                        f"memo passed {self.max_bytes:,} bytes after {self.states:,} states "
+                        f"(dense {self.dense_bytes:,}, sparse {self.sparse_bytes:,})")
+                if self.shelf is None:
+                    self.shelf = shelve.open(self.spill_path, flag="n")
+                self.shelf[repr(key)] = value
+                self.spilled += 1
+            else:
+                self.sparse[key] = value
+                self.sparse_bytes += cost
+
+    # the dense fill and, without a cap, the dict size are counted on demand,
+    # so the per-call path never touches them
+    @property
+    def dense_count(self) -> int:
+        if self.dense is None:
+            return 0
+        if self.filled is not None:
+            return self.filled.count(1)
+        return len(self.dense) - self.dense.count(_MISSING)
+
+    @property
+    def states(self) -> int:
+        return self.dense_count + len(self.sparse) + self.spilled
+
+    def info(self) -> MemoInfo:
+        # entries are only dropped by cache_clear(), which records the peak first
+        states = self.states
+        sparse_bytes = self.sparse_bytes
+        if self.max_bytes is None:
+            sparse_bytes = sys.getsizeof(self.sparse) + sum(
+                _entry_bytes(k, v) for k, v in self.sparse.items())
+        return MemoInfo(self.hits, self.misses, states, max(self.peak, states),
+                        self.dense_bytes, sparse_bytes, self.spilled)
+
+
+def _entry_bytes(key, value) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value) + 3 * _POINTER
+
+
+def memo(shape: Optional[Tuple[int, ...]] = None, typecode: Optional[str] = None,
+         max_bytes: Optional[int] = None, spill: Optional[str] = None):
+    """
+    Args:
+        shape: bounds of the dense part, one dimension per positional argument;
+            states with ints in [0, dim) use the preallocated table.
+        typecode: array typecode for dense values ('b', 'i', 'q', 'd', ...), or
+            None to store arbitrary objects (big ints, tuples).
+        max_bytes: cap on the approximate memo size.
+        spill: shelve path for entries past `max_bytes` instead of raising.
+    """
+    def decorate(fn):
+        store = _Store(shape, typecode, max_bytes, spill)
+
+        if max_bytes is not None or (store.shape and len(store.shape) > 3):
+            wrapper = _checked_wrapper(fn, store)
+        else:
+            wrapper = _fast_wrapper(fn, store)
+        wrapper = wraps(fn)(wrapper)
+        wrapper.cache_info = store.info
+        wrapper.cache_clear = store.clear
+        wrapper.store = store
+        return wrapper
+
+    return decorate
+
+
+def _checked_wrapper(fn, store):
+    # byte caps and 4+-D shapes go through the store's index/get/put
+    index, get, put = store.index, store.get, store.put
+
+    def wrapper(*args):
+        flat = index(args)
+        value = get(args, flat)
+        if value is not _MISSING:
+            store.hits += 1
+            return value
+        store.misses += 1
+        value = fn(*args)
+        put(args, flat, value)
+        return value
+
+    return wrapper
+
+
+def _fast_wrapper(fn, store):
+    # no cap: the table lookups are inlined, one wrapper per rank, so a hit
+    # costs about what lru_cache's does and a miss adds a single frame
+    dense, filled, sparse = store.dense, store.filled, store.sparse
+
+    def outside(*args):
+        value = sparse.get(args, _MISSING)
+        if value is not _MISSING:
+            store.hits += 1
+            return value
+        store.misses += 1
+        value = sparse[args] = fn(*args)
+        return value
+
+    if store.shape is None:
+        return outside
+
+    if len(store.shape) == 1:
+        (d0,) = store.shape
+
+        def wrapper(i):
+            if type(i) is not int or not 0 <= i < d0:
+                return outside(i)
+            if filled is None:
+                value = dense[i]
+                if value is not _MISSING:
+                    store.hits += 1
+                    return value
+            elif filled[i]:
+                store.hits += 1
+                return dense[i]
+            store.misses += 1
+            value = dense[i] = fn(i)
+            if filled is not None:
+                filled[i] = 1
+            return value
+
+    elif len(store.shape) == 2:
+        d0, d1 = store.shape
+
+        def wrapper(i, j):
+            if type(i) is not int or type(j) is not int or not (0 <= i < d0 and 0 <= j < d1):
+                return outside(i, j)
+            flat = i * d1 + j
+            if filled is None:
+                value = dense[flat]
+                if value is not _MISSING:
+                    store.hits += 1
+                    return value
+            elif filled[flat]:
+                store.hits += 1
+                return dense[flat]
+            store.misses += 1
+            value = dense[flat] = fn(i, j)
+            if filled is not None:
+                filled[flat] = 1
+            return value
+
+    else:
+        d0, d1, d2 = store.shape
+
+        def wrapper(i, j, k):
+            if (type(i) is not int or type(j) is not int or type(k) is not int
+                    or not (0 <= i < d0 and 0 <= j < d1 and 0 <= k < d2)):
+                return outside(i, j, k)
+            flat = (i * d1 + j) * d2 + k
+            if filled is None:
+                value = dense[flat]
+                if value is not _MISSING:
+                    store.hits += 1
+                    return value
+            elif filled[flat]:
+                store.hits += 1
+                return dense[flat]
+            store.misses += 1
+            value = dense[flat] = fn(i, j, k)
+            if filled is not None:
+                filled[flat] = 1
+            return value
+
+    return wrapper
@@ -0,0 +1,242 @@
+"""
+Recursion-free evaluation of top-down memoized DPs.
+
+A top-down `dp(...)` recurses once per state, so a dependency chain of 10^5+
+states hits the recursion limit, and raising the limit only moves the crash to
+the C stack. Here the same recurrence is written as a generator that *yields*
+the sub-state it needs and receives the value back:
+
+    @stack_dp(shape=(n + 2,))
+    def dp(i):
+        if i == n:
+            return 1
+        if s[i] == '0':
+            return 0
+        ways = yield i + 1               # instead of dp(i + 1)
+        if i + 1 < n and (s[i] == '1' or (s[i] == '2' and s[i + 1] <= '6')):
+            ways += yield i + 2
+        return ways
+
+    dp(0)
+
+Yield a tuple for multi-argument states (`yield (i + 1, j)`). The evaluator
+keeps the suspended generators on an explicit list, so depth is bounded only by
+memory. Results go through the same store as `dp_memo.memo` (dense table,
+dict fallback, stats, byte cap), and `dp.cache_info()` works the same way.
+As with any memoized DP, the state graph must be acyclic. The reference
+solutions of LC 91, 309, 322, 518, 1143 and 1770 are written this way.
+
+Plain-object results with no `max_bytes` run on an inlined loop over the
+dense list / dict, flattening int and 2-tuple states itself; typed tables and
+byte caps go through the store's generic index/get/put. The cycle collector is
+paused while a call runs.
+
+`python -m algorithms.dp_stack` compares it with sys.setrecursionlimit + a big
+thread stack on a 10^6-state chain.
+"""
+
+import gc
+from functools import wraps
+from typing import Optional, Tuple
+
+from .dp_memo import _MISSING, _Store
+
+
+def stack_dp(shape: Optional[Tuple[int, ...]] = None, typecode: Optional[str] = None,
+             max_bytes: Optional[int] = None, spill: Optional[str] = None):
+    """Same arguments as `dp_memo.memo`; decorates a generator-style dp."""
+    def decorate(fn):
+        store = _Store(shape, typecode, max_bytes, spill)
+        # plain objects in the dense list or the dict, no cap to check per insert
+        lean = typecode is None and max_bytes is None
+        run = _run_lean if lean else _run
+
+        @wraps(fn)
+        def wrapper(*args):
+            flat = store.index(args)
+            value = store.get(args, flat)
+            if value is not _MISSING:
+                store.hits += 1
+                return value
+            # every suspended generator is tracked by the cycle collector, so with
+            # 10^6 of them alive each full collection walks the whole stack
+            enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return run(fn, store, args, flat)
+            finally:
+                if enabled:
+                    gc.enable()
+
+        wrapper.cache_info = store.info
+        wrapper.cache_clear = store.clear
+        wrapper.store = store
+        return wrapper
+
+    return decorate
+
+
+def _run_lean(fn, store, args, flat):
+    # int keys are slots of the dense list, tuple keys live in the dict
+    dense, sparse, index = store.dense, store.sparse, store.index
+    get = sparse.get
+    shape = store.shape or ()
+    # int requests and 2-tuples are flattened here, other tuples by the store
+    d0 = shape[0] if len(shape) == 1 else 0
+    r0, r1 = shape if len(shape) == 2 else (0, 0)
+    hits, misses = 0, 1
+
+    # `send` resumes the generator for `key`; its callers wait on `stack`
+    stack = []
+    push, pop = stack.append, stack.pop
+    key = flat if flat >= 0 else args
+    send, sent = fn(*args).send, None
+    try:
+        while True:
+            try:
+                while True:
+                    req = send(sent)
+                    if type(req) is int:
+                        if 0 <= req < d0:
+                            sent = dense[req]
+                            if sent is _MISSING:
+                                push(key)
+                                push(send)
+                                key, send, sent = req, fn(req).send, None
+                                misses += 1
+                            else:
+                                hits += 1
+                            continue
+                        req = (req,)
+                        rflat = -1
+                    elif len(req) == 2:
+                        i, j = req
+                        if type(i) is int and type(j) is int and 0 <= i < r0 and 0 <= j < r1:
+                            rflat = i * r1 + j
+                        else:
+                            rflat = -1
+                    else:
+                        rflat = index(req)
+                    sent = dense[rflat] if rflat >= 0 else get(req, _MISSING)
+                    if sent is _MISSING:
+                        push(key)
+                        push(send)
+                        key = rflat if rflat >= 0 else req
+                        send, sent = fn(*req).send, None
+                        misses += 1
+                    else:
+                        hits += 1
+            except StopIteration as done:
+                sent = done.value
+                if type(key) is int:
+                    dense[key] = sent
+                else:
+                    sparse[key] = sent
+                if not stack:
+                    return sent
+                send = pop()
+                key = pop()
+    finally:
+        store.hits += hits
+        store.misses += misses
+
+
+def _run(fn, store, args, flat):
+    # typed dense tables and byte caps go through the store
+    index, get, put = store.index, store.get, store.put
+    hits, misses = 0, 1
+
+    stack = []
+    push, pop = stack.append, stack.pop
+    key, send, sent = args, fn(*args).send, None
+    try:
+        while True:
+            try:
+                req = send(sent)
+            except StopIteration as done:
+                sent = done.value
+                put(key, flat, sent)
+                if not stack:
+                    return sent
+                key, flat, send = pop()
+                continue
+
+            if type(req) is not tuple:
+                req = (req,)
+            rflat = index(req)
+            value = get(req, rflat)
+            if value is not _MISSING:
+                hits += 1
+                sent = value
+                continue
+            push((key, flat, send))
+            key, flat, send, sent = req, rflat, fn(*req).send, None
+            misses += 1
+    finally:
+        store.hits += hits
+        store.misses += misses
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import threading
+    import time
+    from functools import lru_cache
+
+    from .dp_memo import memo
+
+    n = 10 ** 6
+    rng = random.Random(0)
+    s = "".join(rng.choice("1112226") for _ in range(n))
+    mod = 10 ** 9 + 7
+
+    @stack_dp(shape=(n + 2,))
+    def dp(i):
+        if i == n:
+            return 1
+        if s[i] == "0":
+            return 0
+        ways = yield i + 1
+        if i + 1 < n and (s[i] == "1" or (s[i] == "2" and s[i + 1] <= "6")):
+            ways = (ways + (yield i + 2)) % mod
+        return ways
+
+    start = time.perf_counter()
+    a = dp(0)
+    print(f"stack_dp:                {time.perf_counter() - start:.2f}s  {dp.cache_info()}")
+
+    def recursive(cache):
+        @cache
+        def rec(i):
+            if i == n:
+                return 1
+            if s[i] == "0":
+                return 0
+            ways = rec(i + 1)
+            if i + 1 < n and (s[i] == "1" or (s[i] == "2" and s[i + 1] <= "6")):
+                ways = (ways + rec(i + 2)) % mod
+            return ways
+        return rec
+
+    def on_big_stack(rec):
+        out = {}
+
+        def run():
+            start = time.perf_counter()
+            out["value"] = rec(0)
+            out["seconds"] = time.perf_counter() - start
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        worker.join()
+        return out
+
+    sys.setrecursionlimit(n * 3)
+    threading.stack_size(1 << 30)
+    for label, cache in (("memo store", memo(shape=(n + 2,), typecode="q")), ("lru_cache", lru_cache(None))):
+        out = on_big_stack(recursive(cache))
+        if "value" in out:
+            print(f"recursion + {label:11s} {out['seconds']:.2f}s  same answer: {out['value'] == a}")
+        else:
+            print(f"recursion + {label:11s} failed")
@@ -0,0 +1,162 @@
+"""
+Problem id -> callable, loaded lazily from the solution files.
+
+The files under LC/ have hyphenated names and mixed calling conventions, so
+they are loaded by path and wrapped into plain callables:
+
+- "Solution.m"  -> bound method of a fresh Solution()
+- "self:f"      -> module-level function written with a leftover `self`
+                   parameter; called with self=None
+- "f"           -> module-level function
+- "Cls(k).m"    -> the first k arguments build a Cls, the rest go to its method m.
+                   With k > 0 the object is an index over those arguments (a
+                   graph, a trie, a coin table): the last BUILT_MAX are kept per
+                   process, keyed on the arguments' repr, so tasks on the same
+                   graph reuse it. k == 0 objects hold state; one per call.
+
+SOLUTIONS holds the LeetCode-signature reference entry of each problem.
+ENGINES adds the scalable versions that live next to it, under "<id>:<name>"
+(e.g. "00091:stream"); their signatures are those of the functions they name.
+
+Nothing is imported until a problem is first requested, and each module is
+imported at most once per process.
+"""
+
+import functools
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+BUILT_MAX = 4  # "Cls(k).m" objects kept per process
+
+SOLUTIONS = {
+    "00091": ("LC/00091_decode-ways.py", "Solution.numDecodings"),
+    "00121": ("LC/00121_best-time-to-buy-and-sell-stock.py", "Solution.maxProfit"),
+    "00139": ("LC/00139_word-break.py", "Solution.wordBreak"),
+    "00188": ("LC/00188_best-time-to-buy-and-sell-stock-iv.py", "Solution.maxProfit"),
+    "00198": ("LC/00198_house_robber.py", "rob"),
+    "00221": ("LC/00221_maximal-square.py", "Solution.maximalSquare"),
+    "00300": ("LC/00300_longest-increasing-subsequence.py", "Solution.lengthOfLIS"),
+    "00309": ("LC/00309_best-time-to-buy-and-sell-stock-with-cooldown.py", "Solution.maxProfit"),
+    "00322": ("LC/00322_coin-change.py", "Solution.coinChange"),
+    "00323": ("LC/00323_number-of-connected-components-in-an-undirected-graph.py", "Solution.countComponents"),
+    "00518": ("LC/00518_coin-change-ii.py", "Solution.change"),
+    "00547": ("LC/00547_number-of-provinces.py", "Solution.findCircleNum"),
+    "00740": ("LC/00740_delete_and_earn.py", "self:deleteAndEarn"),
+    "00743": ("LC/00743_network-delay-time.py", "Solution.networkDelayTime"),
+    "00746": ("LC/00746_min_cost_climbing_stairs.py", "minCostClimbingStairs"),
+    "00797": ("LC/00797_all_paths_from_source_to_target.py", "Solution.allPathsSourceTarget"),
+    "00918": ("LC/00918_maximum-sum-circular-subarray.py", "Solution.maxSubarraySumCircular"),
+    "01101": ("LC/01101_the-earliest-moment-when-everyone-become-friends.py", "Solution.earliestAcq"),
+    "01137": ("LC/01137_n-th-tribonacci-number.py", "self:tribonacci"),
+    "01143": ("LC/01143_longest-common-subsequence.py", "self:longestCommonSubsequence"),
+    "01202": ("LC/01202_smallest-string-with-swaps.py", "Solution.smallestStringWithSwaps"),
+    "01335": ("LC/01335_minimum-difficulty-of-a-job-schedule.py", "Solution.minDifficulty"),
+    "01349": ("LC/01349_maximum-students-taking-exam.py", "Solution.maxStudents"),
+    "01770": ("LC/01770_maximum-score-from-performing-multiplication-operations.py", "self:maximumScore"),
+    "01971": ("LC/01971_find-if-path-exists-in-graph.py", "Solution.validPath"),
+    "wild/count_paths_by_types": ("wild/count_paths_by_types_topdown.py", "count_valid_paths_topdown"),
+}
+
+ENGINES = {
+    "00091:stream": (SOLUTIONS["00091"][0], "num_decodings_stream"),
+    "00091:file": (SOLUTIONS["00091"][0], "num_decodings_file"),
+    "00121:chunks": (SOLUTIONS["00121"][0], "max_profit_chunks"),
+    "00121:file": (SOLUTIONS["00121"][0], "max_profit_file"),
+    "00139:trie": (SOLUTIONS["00139"][0], "WordDict(1).word_break"),
+    "00139:trie_many": (SOLUTIONS["00139"][0], "WordDict(1).word_break_many"),
+    "00188:aliens": (SOLUTIONS["00188"][0], "max_profit_aliens"),
+    "00188:rolling": (SOLUTIONS["00188"][0], "max_profit_rolling"),
+    "00221:rows": (SOLUTIONS["00221"][0], "largest_square"),
+    "00300:patience": (SOLUTIONS["00300"][0], "PatienceLIS(0).extend"),
+    "00322:table": (SOLUTIONS["00322"][0], "CoinSet(1).min_coins"),
+    "00322:table_many": (SOLUTIONS["00322"][0], "CoinSet(1).min_coins_many"),
+    "00518:table": (SOLUTIONS["00518"][0], "CoinSet(1).ways"),
+    "00518:table_many": (SOLUTIONS["00518"][0], "CoinSet(1).ways_many"),
+    "00740:compressed": (SOLUTIONS["00740"][0], "delete_and_earn_compressed"),
+    "00743:csr": (SOLUTIONS["00743"][0], "CSRGraph(2).network_delay"),
+    "00743:csr_many": (SOLUTIONS["00743"][0], "CSRGraph(2).network_delay_many"),
+    "00797:count": (SOLUTIONS["00797"][0], "count_paths"),
+    "00797:page": (SOLUTIONS["00797"][0], "paths_page"),
+    "00918:chunks": (SOLUTIONS["00918"][0], "max_subarray_sum_circular_chunks"),
+    "00918:file": (SOLUTIONS["00918"][0], "max_subarray_sum_circular_file"),
+    "01101:stream": (SOLUTIONS["01101"][0], "earliest_acq_stream"),
+    "01101:during": (SOLUTIONS["01101"][0], "connected_during"),
+    "01137:fast": (SOLUTIONS["01137"][0], "tribonacci_fast"),
+    "01143:bits": (SOLUTIONS["01143"][0], "lcs_length_bits"),
+    "01143:rolling": (SOLUTIONS["01143"][0], "lcs_length_rolling"),
+    "01143:string": (SOLUTIONS["01143"][0], "lcs_string"),
+    "01202:bytes": (SOLUTIONS["01202"][0], "smallest_string_with_swaps"),
+    "01202:file": (SOLUTIONS["01202"][0], "smallest_file_with_swaps"),
+    "01335:fast": (SOLUTIONS["01335"][0], "min_difficulty"),
+    "01349:fast": (SOLUTIONS["01349"][0], "max_students"),
+    "01770:rows": (SOLUTIONS["01770"][0], "maximum_score_rows"),
+    "01971:index": (SOLUTIONS["01971"][0], "ReachabilityIndex(2).connected"),
+    "01971:index_many": (SOLUTIONS["01971"][0], "ReachabilityIndex(2).connected_many"),
+    "01971:index_pairs": (SOLUTIONS["01971"][0], "ReachabilityIndex(2).connected_pairs"),
+    "01971:bidirectional": (SOLUTIONS["01971"][0], "valid_path_bidirectional"),
+    "wild/count_paths_by_types:layered": (SOLUTIONS["wild/count_paths_by_types"][0], "count_valid_paths_layered"),
+}
+
+
+def normalize(problem_id) -> str:
+    # 743, "743" and "00743" all name the same problem; "743:csr" -> "00743:csr"
+    base, sep, variant = str(problem_id).partition(":")
+    if base.isdigit():
+        base = base.zfill(5)
+    return base + sep + variant
+
+
+def problems() -> list[str]:
+    return list(SOLUTIONS) + list(ENGINES)
+
+
+@functools.lru_cache(None)
+def load_module(path: str):
+    spec = importlib.util.spec_from_file_location(
+        "algorithms._" + Path(path).stem.replace("-", "_"), ROOT / path)
+    module = importlib.util.module_from_spec(spec)
+    # registered so pickle can find its functions (process pools, shared memory workers)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get(problem_id) -> Callable:
+    """Callable for `problem_id`; raises KeyError for unknown ids."""
+    key = normalize(problem_id)
+    if key not in SOLUTIONS and key not in ENGINES:
+        raise KeyError(f"unknown problem id {problem_id!r}")
+    path, entry = SOLUTIONS[key] if key in SOLUTIONS else ENGINES[key]
+    module = load_module(path)
+    if entry.startswith("Solution."):
+        # a fresh instance per call, as LeetCode does
+        method = entry.split(".", 1)[1]
+        return lambda *args, **kwargs: getattr(module.Solution(), method)(*args, **kwargs)
+    if entry.startswith("self:"):
+        return functools.partial(getattr(module, entry[5:]), None)
+    if "(" in entry:
+        name, _, rest = entry.partition("(")
+        arity, _, method = rest.partition(").")
+        cls, k = getattr(module, name), int(arity)
+        if k == 0:
+            return lambda *args, **kwargs: getattr(cls(), method)(*args, **kwargs)
+        return lambda *args, **kwargs: getattr(_built(cls, args[:k]), method)(*args[k:], **kwargs)
+    return getattr(module, entry)
+
+
+_BUILT = {}  # (class, repr of its arguments) -> object, least recently used first
+
+
+def _built(cls, args):
+    # repr is one C-level pass over the arguments, far cheaper than rebuilding
+    key = (cls, repr(args))
+    obj = _BUILT.pop(key, None)
+    if obj is None:
+        obj = cls(*args)
+        if len(_BUILT) >= BUILT_MAX:
+            del _BUILT[next(iter(_BUILT))]
+    _BUILT[key] = obj
+    return obj
@@ -0,0 +1,53 @@
+"""
+Array-backed union-find shared by the connectivity solutions (LC 323, 547,
+1101, 1202, 1971).
+
+parent/size live in array('i') (4 bytes per slot instead of a pointer plus an
+int object), find uses iterative path halving, union is by size, and the
+component count is kept live. See graphs_notes/union_find.md.
+"""
+
+from array import array
+
+
+class UF:
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.components = n
+
+    def find(self, x: int) -> int:
+        # iterative path halving, no recursion on long chains
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        # union by size
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self.components -= 1
+        return True
+
+    def union_many(self, edges) -> int:
+        # bulk union, returns the number of merges
+        union = self.union
+        merged = 0
+        for a, b in edges:
+            if union(a, b):
+                merged += 1
+        return merged
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def all_connected(self) -> bool:
+        return self.components == 1
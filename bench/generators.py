@@ -0,0 +1,178 @@
+"""
+Seeded input generators, one per problem.
+
+Each generator takes (rng, size) and returns the positional arguments for the
+solution. `size` is the nominal input size (array length, node count, amount,
+...); 2-D problems use a side of about sqrt(size) so the cell count tracks it.
+"""
+
+import random
+from math import isqrt
+
+
+def _digits(rng: random.Random, size: int):
+    # mostly 1s and 2s so there are many two-digit decodings
+    return ("".join(rng.choice("1112226") for _ in range(size)),)
+
+
+def _prices(rng: random.Random, size: int):
+    return ([rng.randint(0, 1000) for _ in range(size)],)
+
+
+def _word_break(rng: random.Random, size: int):
+    words = sorted({"".join(rng.choice("ab") for _ in range(rng.randint(1, 4))) for _ in range(20)})
+    s = "".join(rng.choice(words) for _ in range(size // 2 + 1))[:size]
+    return s, words
+
+
+def _stock_k(rng: random.Random, size: int):
+    return max(1, size // 10), [rng.randint(0, 1000) for _ in range(size)]
+
+
+def _nums(rng: random.Random, size: int):
+    return ([rng.randint(0, 1000) for _ in range(size)],)
+
+
+def _signed_nums(rng: random.Random, size: int):
+    return ([rng.randint(-1000, 1000) for _ in range(size)],)
+
+
+def _square_grid(rng: random.Random, size: int):
+    side = max(1, isqrt(size))
+    return ([[rng.choice("1110") for _ in range(side)] for _ in range(side)],)
+
+
+def _coin_change(rng: random.Random, size: int):
+    return [1, 7, 13, 29], size
+
+
+def _coin_change_ii(rng: random.Random, size: int):
+    return size, [1, 7, 13, 29]
+
+
+def _edges(rng: random.Random, n: int, m: int):
+    return [[rng.randrange(n), rng.randrange(n)] for _ in range(m)]
+
+
+def _components(rng: random.Random, size: int):
+    return size, _edges(rng, size, size // 2)
+
+
+def _provinces(rng: random.Random, size: int):
+    side = max(1, isqrt(size))
+    grid = [[0] * side for _ in range(side)]
+    for i in range(side):
+        grid[i][i] = 1
+    for a, b in _edges(rng, side, side // 2):
+        grid[a][b] = grid[b][a] = 1
+    return (grid,)
+
+
+def _delete_and_earn(rng: random.Random, size: int):
+    return ([rng.randint(1, size) for _ in range(size)],)
+
+
+def _network_delay(rng: random.Random, size: int):
+    n = max(2, size // 4)
+    times = [[rng.randint(1, n), rng.randint(1, n), rng.randint(1, 100)] for _ in range(size)]
+    times += [[i, i + 1, 100] for i in range(1, n)]  # keep everything reachable from 1
+    return times, n, 1
+
+
+def _costs(rng: random.Random, size: int):
+    return ([rng.randint(0, 999) for _ in range(max(2, size))],)
+
+
+def _dag(rng: random.Random, size: int):
+    # each node links to 1-2 of the next few nodes: path count grows exponentially
+    n = max(2, size)
+    graph = []
+    for i in range(n - 1):
+        graph.append(sorted(set(rng.randint(i + 1, min(n - 1, i + 4)) for _ in range(2))))
+    graph.append([])
+    return (graph,)
+
+
+def _friend_logs(rng: random.Random, size: int):
+    n = max(2, size // 4)
+    logs = [[t, rng.randrange(n), rng.randrange(n)] for t in rng.sample(range(size * 10), size)]
+    return logs, n
+
+
+def _tribonacci(rng: random.Random, size: int):
+    return (size,)
+
+
+def _lcs(rng: random.Random, size: int):
+    a = "".join(rng.choice("ACGT") for _ in range(size))
+    b = "".join(rng.choice("ACGT") for _ in range(size))
+    return a, b
+
+
+def _swaps(rng: random.Random, size: int):
+    s = "".join(rng.choice("abcdefghij") for _ in range(max(1, size)))
+    return s, _edges(rng, len(s), size // 2)
+
+
+def _jobs(rng: random.Random, size: int):
+    n = max(1, size)
+    return [rng.randint(0, 1000) for _ in range(n)], min(10, n)
+
+
+def _seats(rng: random.Random, size: int):
+    rows = max(1, size // 8)
+    return ([[rng.choice("..#") for _ in range(8)] for _ in range(rows)],)
+
+
+def _max_score(rng: random.Random, size: int):
+    n = max(1, size)
+    nums = [rng.randint(-1000, 1000) for _ in range(n)]
+    return nums, [rng.randint(-1000, 1000) for _ in range(max(1, n // 2))]
+
+
+def _valid_path(rng: random.Random, size: int):
+    n = max(2, size)
+    return n, _edges(rng, n, n), 0, n - 1
+
+
+def _shop_paths(rng: random.Random, size: int):
+    # size doubles -> one more distinct type
+    T = max(1, size.bit_length() - 2)
+    n = 4 * T
+    shop_types = [f"t{rng.randrange(T)}" for _ in range(n)]
+    roads = list({tuple(sorted(rng.sample(range(n), 2))) for _ in range(3 * n)})
+    return shop_types, roads
+
+
+GENERATORS = {
+    "00091": _digits,
+    "00121": _prices,
+    "00139": _word_break,
+    "00188": _stock_k,
+    "00198": _nums,
+    "00221": _square_grid,
+    "00300": _signed_nums,
+    "00309": _prices,
+    "00322": _coin_change,
+    "00323": _components,
+    "00518": _coin_change_ii,
+    "00547": _provinces,
+    "00740": _delete_and_earn,
+    "00743": _network_delay,
+    "00746": _costs,
+    "00797": _dag,
+    "00918": _signed_nums,
+    "01101": _friend_logs,
+    "01137": _tribonacci,
+    "01143": _lcs,
+    "01202": _swaps,
+    "01335": _jobs,
+    "01349": _seats,
+    "01770": _max_score,
+    "01971": _valid_path,
+    "wild/count_paths_by_types": _shop_paths,
+}
+
+
+def make_input(problem_id: str, size: int, seed: int = 0):
+    return GENERATORS[problem_id](random.Random(f"{problem_id}:{size}:{seed}"), size)
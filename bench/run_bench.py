@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for every solution under LC/ and wild/.
+
+Each problem runs at geometrically increasing input sizes (seeded inputs from
+generators.py) until a run exceeds the time budget or fails (e.g. RecursionError).
+Every run happens in a fresh child process, so a blow-up can be killed without
+taking down the suite. For each size we record wall time and, in a second run
+under tracemalloc, peak traced memory.
+
+    python bench/run_bench.py                        # run all, compare to baseline
+    python bench/run_bench.py --only 00743 00091     # a subset
+    python bench/run_bench.py --update               # write results as the new baseline
+
+Exits with status 1 if any problem regressed against the baseline: a size that
+used to finish no longer does, or a run got slower than `--tolerance` times
+its baseline time.
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+from algorithms.registry import SOLUTIONS, get  # noqa: E402
+from generators import GENERATORS, make_input  # noqa: E402
+
+
+def _child(problem_id: str, size: int, seed: int, trace: bool, conn) -> None:
+    try:
+        fn = get(problem_id)
+        args = make_input(problem_id, size, seed)
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        fn(*args)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace else None
+        conn.send({"seconds": seconds, "peak_bytes": peak})
+    except BaseException as exc:  # RecursionError, MemoryError, ...
+        conn.send({"error": f"{type(exc).__name__}: {exc}"[:200]})
+    finally:
+        conn.close()
+
+
+def measure(problem_id: str, size: int, seed: int, timeout: float, trace: bool = False) -> dict:
+    recv, send = mp.Pipe(duplex=False)
+    proc = mp.Process(target=_child, args=(problem_id, size, seed, trace, send))
+    proc.start()
+    send.close()
+    result = recv.recv() if recv.poll(timeout) else {"error": f"timeout after {timeout:g}s"}
+    if proc.is_alive():
+        proc.kill()
+    proc.join()
+    return result
+
+
+def run_problem(problem_id: str, budget: float, start_size: int, max_size: int, seed: int) -> dict:
+    runs = []
+    largest_ok = 0
+    size = start_size
+    while size <= max_size:
+        run = {"size": size}
+        run.update(measure(problem_id, size, seed, timeout=budget))
+        if "error" not in run:
+            traced = measure(problem_id, size, seed, timeout=budget * 20, trace=True)
+            run["peak_bytes"] = traced.get("peak_bytes")
+        runs.append(run)
+        if "error" in run or run["seconds"] > budget:
+            break
+        largest_ok = size
+        size *= 2
+    return {"runs": runs, "largest_ok": largest_ok}
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_seconds: float) -> list[str]:
+    problems = []
+    for pid, res in results.items():
+        base = baseline.get(pid)
+        if base is None:
+            continue
+        if res["largest_ok"] < base["largest_ok"]:
+            problems.append(f"{pid}: largest size within budget dropped "
+                            f"{base['largest_ok']} -> {res['largest_ok']}")
+        old = {r["size"]: r["seconds"] for r in base["runs"] if "seconds" in r}
+        for run in res["runs"]:
+            was = old.get(run["size"])
+            now = run.get("seconds")
+            if was is not None and now is not None and now > min_seconds and now > was * tolerance:
+                problems.append(f"{pid}: size {run['size']} took {now:.3f}s (baseline {was:.3f}s)")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", nargs="*", help="problem ids to run (default: all)")
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds per run before a size counts as too slow")
+    parser.add_argument("--start-size", type=int, default=16)
+    parser.add_argument("--max-size", type=int, default=1 << 20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    parser.add_argument("--out", type=Path, default=HERE / "latest.json")
+    parser.add_argument("--update", action="store_true", help="also write results to the baseline file")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown factor vs baseline")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="ignore slowdowns of runs faster than this")
+    args = parser.parse_args(argv)
+
+    ids = args.only or list(SOLUTIONS)
+    unknown = [pid for pid in ids if pid not in SOLUTIONS or pid not in GENERATORS]
+    if unknown:
+        parser.error(f"unknown problem ids: {', '.join(unknown)}")
+
+    results = {}
+    for pid in ids:
+        res = run_problem(pid, args.budget, args.start_size, args.max_size, args.seed)
+        results[pid] = res
+        last = res["runs"][-1]
+        stop = last.get("error") or f"{last['seconds']:.3f}s at {last['size']}"
+        print(f"{pid:28s} largest_ok={res['largest_ok']:<8d} stopped: {stop}")
+
+    report = {
+        "meta": {"python": platform.python_version(), "budget": args.budget, "seed": args.seed},
+        "results": results,
+    }
+    args.out.write_text(json.dumps(report, indent=2) + "\n")
+
+    regressions = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+        for line in regressions:
+            print("REGRESSION", line)
+    if args.update:
+        merged = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"results": {}}
+        merged["meta"] = report["meta"]
+        merged["results"].update(results)
+        args.baseline.write_text(json.dumps(merged, indent=2) + "\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
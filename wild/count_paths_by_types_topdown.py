@@ -54,9 +54,15 @@ we count 1.
 This counts each order separately because the DFS explores different sequences.
 """
 
-from functools import lru_cache
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from collections import defaultdict
-from typing import List, Tuple
+from itertools import combinations
+from math import comb
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from algorithms.dp_memo import memo
 
 
 def count_valid_paths_topdown(shop_types: List[str], roads: List[Tuple[int, int]]) -> int:
@@ -93,7 +99,7 @@ def count_valid_paths_topdown(shop_types: List[str], roads: List[Tuple[int, int]
     # Precompute type bit for each node
     node_tbit = [tbit[tp] for tp in shop_types]
 
-    @lru_cache(maxsize=None)
+    @memo(shape=(n, 1 << T))  # counts can be big ints, so plain objects
     def dfs(node: int, mask: int) -> int:
         """
         Number of paths ending at `node` having already used the set of types in `mask`.
@@ -120,6 +126,269 @@ def count_valid_paths_topdown(shop_types: List[str], roads: List[Tuple[int, int]
     return ans
 
 
+
+# --------------------------
+# Bottom-up, layered by popcount
+# --------------------------
+#
+# cnt[mask][v] = number of paths ending at v that use exactly the types in mask.
+# Pull form: cnt[mask][v] = sum(cnt[mask ^ bit(v)][u] for u in graph[v]), and a
+# mask only depends on masks with one bit fewer, so we keep just two popcount
+# layers. Within a layer, masks are stored in increasing numeric order, which
+# for a fixed popcount is colex order, so a mask's row is its colex rank and no
+# dict is needed. Each row is a flat block of n counts.
+
+def _colex_rank(mask: int, binom: List[List[int]]) -> int:
+    rank, i = 0, 1
+    while mask:
+        low = mask & -mask
+        rank += binom[low.bit_length() - 1][i]
+        mask ^= low
+        i += 1
+    return rank
+
+
+def _fill_layer(prev, cur, masks, first: int, ctx) -> None:
+    """Fill rows first .. first+len(masks)-1 of `cur` from the previous layer."""
+    graph, nodes_by_type, n, mod, binom = ctx
+    for r, mask in enumerate(masks, first):
+        off = r * n
+        rest = mask
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            base = _colex_rank(mask ^ low, binom) * n
+            for v in nodes_by_type[low.bit_length() - 1]:
+                total = 0
+                for u in graph[v]:
+                    total += prev[base + u]
+                cur[off + v] = total % mod if mod else total
+
+
+_worker_ctx = None
+
+
+def _init_worker(ctx) -> None:
+    global _worker_ctx
+    _worker_ctx = ctx
+
+
+def _fill_layer_shared(prev_name: str, cur_name: str, masks: List[int], first: int) -> None:
+    prev_shm = shared_memory.SharedMemory(name=prev_name)
+    cur_shm = shared_memory.SharedMemory(name=cur_name)
+    prev, cur = prev_shm.buf.cast("q"), cur_shm.buf.cast("q")
+    try:
+        _fill_layer(prev, cur, masks, first, _worker_ctx)
+    finally:
+        prev.release()
+        cur.release()
+        prev_shm.close()
+        cur_shm.close()
+
+
+def count_valid_paths_layered(
+    shop_types: List[str],
+    roads: List[Tuple[int, int]],
+    mod: Optional[int] = None,
+    workers: int = 1,
+) -> int:
+    """
+    Bottom-up version of `count_valid_paths_topdown`: no recursion, no per-state
+    dict entries, and only two popcount layers of C(T, k) * n counts in memory.
+
+    Args:
+        shop_types: list of shop type strings of length n.
+        roads: list of undirected edges (u, v).
+        mod: if given, counts are kept modulo `mod` in fixed-width int64 arrays.
+        workers: with `mod`, split each layer's masks across this many processes
+            that read/write the layers through shared memory.
+
+    Returns:
+        Total number of valid paths (modulo `mod` if given).
+    """
+    n = len(shop_types)
+    if n == 0:
+        return 0
+    if workers > 1 and not mod:
+        raise ValueError("workers > 1 needs mod (shared layers are int64)")
+
+    graph = [[] for _ in range(n)]
+    for u, v in roads:
+        if u != v:
+            graph[u].append(v)
+            graph[v].append(u)
+
+    distinct_types = list(dict.fromkeys(shop_types))
+    T = len(distinct_types)
+    tbit = {t: i for i, t in enumerate(distinct_types)}
+    nodes_by_type = [[] for _ in range(T)]
+    for v, tp in enumerate(shop_types):
+        nodes_by_type[tbit[tp]].append(v)
+    binom = [[comb(b, i) for i in range(T + 1)] for b in range(T)]
+    ctx = (graph, nodes_by_type, n, mod, binom)
+
+    # layer 1: single-node paths
+    prev = array("q", [0]) * (T * n) if mod else [0] * (T * n)
+    for v, tp in enumerate(shop_types):
+        prev[tbit[tp] * n + v] = 1
+
+    if workers <= 1:
+        for k in range(2, T + 1):
+            masks = sorted(sum(1 << b for b in c) for c in combinations(range(T), k))
+            cur = array("q", [0]) * (len(masks) * n) if mod else [0] * (len(masks) * n)
+            _fill_layer(prev, cur, masks, 0, ctx)
+            prev = cur
+        return sum(prev) % mod if mod else sum(prev)
+
+    prev_shm = shared_memory.SharedMemory(create=True, size=max(1, len(prev) * 8))
+    prev_shm.buf[:len(prev) * 8] = prev.tobytes()
+    size = T * n
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(ctx,)) as pool:
+            for k in range(2, T + 1):
+                masks = sorted(sum(1 << b for b in c) for c in combinations(range(T), k))
+                size = len(masks) * n
+                cur_shm = shared_memory.SharedMemory(create=True, size=size * 8)
+                cur_shm.buf[:size * 8] = bytes(size * 8)
+                step = max(1, -(-len(masks) // (workers * 4)))
+                jobs = [
+                    pool.submit(_fill_layer_shared, prev_shm.name, cur_shm.name, masks[i:i + step], i)
+                    for i in range(0, len(masks), step)
+                ]
+                try:
+                    for job in jobs:
+                        job.result()
+                except BaseException:
+                    cur_shm.close()
+                    cur_shm.unlink()
+                    raise
+                prev_shm.close()
+                prev_shm.unlink()
+                prev_shm = cur_shm
+        last = prev_shm.buf[:size * 8].cast("q")
+        ans = sum(last) % mod
+        last.release()
+        return ans
+    finally:
+        prev_shm.close()
+        prev_shm.unlink()
+
+
+# --------------------------
+# Persistent index over every type subset
+# --------------------------
+
+class TypeCoverageIndex:
+    """
+    Path counts for every subset of types, built once per city map.
+
+    cnt[mask * n + v] = number of valid paths ending at v that use exactly the
+    types in `mask` (one shop per type). Roads are undirected, so reversing a
+    path shows this is also the number of such paths *starting* at v. Masks are
+    filled in increasing numeric order, since mask ^ bit < mask.
+
+    `exact[mask]` sums each row, and `containing[mask]` is its superset-sum (SOS)
+    transform, so both query kinds are table lookups. Memory is O(2^T * n).
+    """
+
+    def __init__(self, shop_types: List[str], roads: List[Tuple[int, int]], mod: Optional[int] = None):
+        self.n = n = len(shop_types)
+        self.mod = mod
+        self.types = list(dict.fromkeys(shop_types))
+        self.tbit = {t: i for i, t in enumerate(self.types)}
+        self.node_tbit = [self.tbit[tp] for tp in shop_types]
+        self.nodes_by_type = [[] for _ in self.types]
+        for v, b in enumerate(self.node_tbit):
+            self.nodes_by_type[b].append(v)
+        self.graph = [[] for _ in range(n)]
+        for u, v in roads:
+            if u != v:
+                self.graph[u].append(v)
+                self.graph[v].append(u)
+
+        size = (1 << len(self.types)) * n
+        self.cnt = array("q", [0]) * size if mod else [0] * size
+        self.exact = [0] * (1 << len(self.types))
+        for v, b in enumerate(self.node_tbit):
+            self.cnt[(1 << b) * n + v] = 1
+        self._recompute(range(1, 1 << len(self.types)))
+
+    def _recompute(self, masks) -> None:
+        # masks must be increasing; single-type rows are the fixed base case
+        cnt, graph, n, mod = self.cnt, self.graph, self.n, self.mod
+        for mask in masks:
+            off = mask * n
+            if mask & (mask - 1):
+                rest = mask
+                while rest:
+                    low = rest & -rest
+                    rest ^= low
+                    base = (mask ^ low) * n
+                    for v in self.nodes_by_type[low.bit_length() - 1]:
+                        total = 0
+                        for u in graph[v]:
+                            total += cnt[base + u]
+                        cnt[off + v] = total % mod if mod else total
+            row = sum(cnt[off:off + n])
+            self.exact[mask] = row % mod if mod else row
+
+        containing = self.exact[:]
+        for b in range(len(self.types)):
+            bit = 1 << b
+            for mask in range(len(containing)):
+                if not mask & bit:
+                    containing[mask] += containing[mask | bit]
+        if mod:
+            containing = [c % mod for c in containing]
+        self.containing = containing
+
+    def _mask(self, types) -> int:
+        mask = 0
+        for t in types:
+            if t not in self.tbit:
+                raise ValueError(f"unknown shop type {t!r}")
+            mask |= 1 << self.tbit[t]
+        return mask
+
+    def count_exact(self, types, start: Optional[int] = None) -> int:
+        """Paths using exactly one shop of each type in `types` (optionally starting at `start`)."""
+        mask = self._mask(types)
+        if start is None:
+            return self.exact[mask]
+        return self.cnt[mask * self.n + start]
+
+    def count_containing(self, types) -> int:
+        """Paths whose set of types includes every type in `types`."""
+        return self.containing[self._mask(types)]
+
+    def count_all(self) -> int:
+        """Same answer as `count_valid_paths_topdown`."""
+        return self.exact[-1] if self.n else 0
+
+    def add_road(self, u: int, v: int) -> None:
+        """
+        Insert a road and refresh only the masks containing both endpoint types;
+        every other mask can't use the new road.
+        """
+        if u == v:
+            return
+        self.graph[u].append(v)
+        self.graph[v].append(u)
+        need = (1 << self.node_tbit[u]) | (1 << self.node_tbit[v])
+        if need & (need - 1) == 0:
+            return  # same type, never on a valid path
+        free = ((1 << len(self.types)) - 1) ^ need
+        supersets = []
+        sub = free
+        while True:
+            supersets.append(sub | need)
+            if sub == 0:
+                break
+            sub = (sub - 1) & free
+        supersets.reverse()
+        self._recompute(supersets)
+
+
 # --------------------------
 # Example usage & quick tests
 # --------------------------
@@ -139,3 +408,12 @@ if __name__ == "__main__":
     shop_types3 = ["x", "y", "z"]
     roads3 = [(0, 1)]  # no road to 2 -> no path that uses all three
     print("Example 3:", count_valid_paths_topdown(shop_types3, roads3))
+
+    # Bottom-up layered engine agrees with the top-down one
+    for st, rd in ((shop_types, roads), (shop_types2, roads2), (shop_types3, roads3)):
+        assert count_valid_paths_layered(st, rd) == count_valid_paths_topdown(st, rd)
+
+    # Index over every type subset
+    index = TypeCoverageIndex(shop_types, roads)
+    print("Paths covering exactly {grocery, sport}:", index.count_exact(["grocery", "sport"]))
+    print("... starting at shop 0:", index.count_exact(["grocery", "sport"], start=0))